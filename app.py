@@ -1,18 +1,114 @@
 import argparse
+import functools
+import importlib
 import json
+import re
 import sys # For sys.exit
 import os # For checking file paths in parse_run_params
-from gradio_client import handle_file # For parse_run_params
 
-# Import from project modules
 try:
-    import space_finder
-    import space_runner
-    import results_manager
-except ModuleNotFoundError:
-    print("Error: One or more required modules (space_finder, space_runner, results_manager) not found.")
-    print("Ensure they are in the same directory as app.py or in PYTHONPATH.")
-    sys.exit(1)
+    import orjson # Optional: much faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
+# JSON helpers: use orjson when available, otherwise fall back to stdlib json
+if orjson:
+    _loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError # Subclass of json.JSONDecodeError
+    # numpy arrays, naive datetimes and non-str keys are serialized natively instead of raising
+    _ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTS).decode()
+
+    def _dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTS | orjson.OPT_INDENT_2).decode()
+
+    # orjson turns integers beyond 64 bits into floats; any run of 19+ digits might be one
+    _LONG_DIGIT_RUN = re.compile(r'\d{19,}')
+
+    def _loads_exact(text: str):
+        """
+        Decodes like json.loads: tokens orjson rejects (NaN, Infinity, 1e400) or that may hold
+        integers beyond 64 bits are handed to json.loads, so they decode as they always have.
+        """
+        if not _LONG_DIGIT_RUN.search(text):
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(text)
+else:
+    _loads = _loads_exact = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=str)
+
+    def _dumps_pretty(obj) -> str:
+        return json.dumps(obj, default=str, indent=2)
+
+# Project modules (and their heavy dependencies, e.g. gradio_client) are imported
+# lazily by the handlers that need them, so small commands start quickly.
+def _lazy_import(name: str):
+    """Imports and returns a module on first use, exiting with a helpful message if it is missing."""
+    try:
+        return importlib.import_module(name)
+    except ModuleNotFoundError as e:
+        print(f"Error: Required module '{e.name}' not found.")
+        print("Ensure space_finder, space_runner and results_manager are in the same directory as app.py or in PYTHONPATH,")
+        print("and that dependencies are installed (pip install -r requirements.txt).")
+        sys.exit(1)
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+# Hugging Face token, read once at startup and shared by all handlers
+_HF_TOKEN = os.environ.get("HF_TOKEN")
+
+# File extensions treated as file inputs by parse_run_params (common ones, can be expanded)
+_FILE_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.wav', '.mp3', '.txt', '.json', '.csv', '.glb', '.gltf', '.mp4', '.avi', '.mov'})
+# Cheap prefilter: a file value must end in one of these characters and have a '.' near its end
+_FILE_EXT_TAILS = frozenset(ext[-1] for ext in _FILE_EXTS) | frozenset(ext[-1].upper() for ext in _FILE_EXTS)
+_FILE_EXT_MAX_LEN = max(len(ext) for ext in _FILE_EXTS)
+_FILE_EXT_LENS = tuple(sorted({len(ext) for ext in _FILE_EXTS}))
+
+def _has_file_ext(value: str) -> bool:
+    """Returns True if value ends with one of _FILE_EXTS (case-insensitive), by slicing off each possible suffix length."""
+    tail = value[-_FILE_EXT_MAX_LEN:].lower()
+    for ext_len in _FILE_EXT_LENS:
+        if tail[-ext_len:] in _FILE_EXTS:
+            return True
+    return False
+
+# Characters a value json.loads accepts can start with (after whitespace, which it skips),
+# including Python's NaN/Infinity extensions; anything else is kept as a plain string
+_JSON_LEAD = frozenset('{["-0123456789tfnNI')
+
+def _decode_json_or_str(value: str):
+    if value.lstrip()[:1] in _JSON_LEAD:
+        try:
+            return _loads_exact(value)
+        except ValueError: # JSONDecodeError, or stdlib's int digit limit
+            pass
+    return value
+
+# Only for values that can't decode to a list/dict: a cached container would be shared by every caller
+_decode_scalar_param_value = functools.lru_cache(maxsize=1024)(_decode_json_or_str)
+
+def _decode_param_value(value: str):
+    """
+    Tries to JSON decode a parameter value (numbers, booleans, objects/arrays), else returns it as a string.
+    Scalar results are cached so repeated tokens are only decoded once; objects/arrays are decoded
+    afresh on every call, so callers may mutate them.
+    """
+    if value.lstrip()[:1] in ('{', '['):
+        return _decode_json_or_str(value)
+    return _decode_scalar_param_value(value)
 
 # Helper function to parse parameters for run commands
 def parse_run_params(params_list: list[str] | None) -> tuple[list, dict]:
@@ -26,42 +122,35 @@ def parse_run_params(params_list: list[str] | None) -> tuple[list, dict]:
     if not params_list:
         return args_out, kwargs_out
 
+    _exists = os.path.exists
     for item in params_list:
-        if '=' in item:
-            key, value = item.split('=', 1)
-            # Check if value is a path to a file (basic check)
-            # Common extensions, can be expanded
-            if isinstance(value, str) and any(value.endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.wav', '.mp3', '.txt', '.json', '.csv', '.glb', '.gltf', '.mp4', '.avi', '.mov']):
-                if os.path.exists(value):
-                    kwargs_out[key] = handle_file(value)
+        key, sep, value = item.partition('=')
+        if sep:
+            # Check if value is a path to a file (basic check on the extension)
+            if value and value[-1] in _FILE_EXT_TAILS and '.' in value[-_FILE_EXT_MAX_LEN:] \
+                    and _has_file_ext(value):
+                if _exists(value):
+                    kwargs_out[key] = _lazy_import("gradio_client").handle_file(value)
                 else:
                     print(f"Warning: File path '{value}' for key '{key}' does not exist. Passing as string.")
                     kwargs_out[key] = value # Pass as string if file not found
             else:
-                try:
-                    # Try to load as JSON (for numbers, booleans, actual JSON objects/arrays)
-                    kwargs_out[key] = json.loads(value)
-                except json.JSONDecodeError:
-                    # If not JSON, keep as string
-                    kwargs_out[key] = value
+                kwargs_out[key] = _decode_param_value(value)
         else:
             # Positional argument, try to JSON decode, else string
-            try:
-                args_out.append(json.loads(item))
-            except json.JSONDecodeError:
-                args_out.append(item)
+            args_out.append(_decode_param_value(item))
     return args_out, kwargs_out
 
 def handle_search_spaces(args):
     """Handles the 'search' command."""
     try:
+        space_finder = _lazy_import("space_finder")
         print(f"Searching for Spaces with task: '{args.task_description}', sort_by: {args.sort_by}, limit: {args.limit}")
-        hf_token = os.environ.get("HF_TOKEN")
         spaces = space_finder.find_spaces(
             task_description=args.task_description,
             sort_by=args.sort_by,
             limit=args.limit,
-            hf_token=hf_token
+            hf_token=_HF_TOKEN
         )
         if spaces:
             print("Found Spaces:")
@@ -76,6 +165,7 @@ def handle_search_spaces(args):
 def handle_favorites_add(args):
     """Handles the 'favorites add' command."""
     try:
+        space_finder = _lazy_import("space_finder")
         space_finder.add_to_favorites(args.space_id)
         print(f"Space '{args.space_id}' added to favorites (if not already present).")
     except Exception as e:
@@ -84,6 +174,7 @@ def handle_favorites_add(args):
 def handle_favorites_list(args):
     """Handles the 'favorites list' command."""
     try:
+        space_finder = _lazy_import("space_finder")
         favorites = space_finder.get_favorite_spaces()
         if favorites:
             print("Favorite Spaces:")
@@ -97,9 +188,9 @@ def handle_favorites_list(args):
 def handle_run_info(args):
     """Handles the 'run info' command."""
     try:
+        space_runner = _lazy_import("space_runner")
         print(f"Fetching API details for Space: {args.space_id}")
-        hf_token = os.environ.get("HF_TOKEN")
-        api_details = space_runner.get_space_api_details(args.space_id, hf_token=hf_token)
+        api_details = space_runner.get_space_api_details(args.space_id, hf_token=_HF_TOKEN)
         if api_details:
             print("API Details:")
             print(api_details) # Already formatted string
@@ -109,43 +200,69 @@ def handle_run_info(args):
         print(f"Error fetching API details: {e}")
 
 # --- Run Command Handlers ---
+def _is_file_result(prediction_result) -> bool:
+    """Returns True if a prediction result is a path to an existing file."""
+    return isinstance(prediction_result, str) and os.path.exists(prediction_result)
+
+def _output_data_for_db(prediction_result, is_file: bool | None = None, serialized: str | None = None):
+    """
+    Returns the value to store as output_data for a prediction result.
+    If the file check was already done, pass it as is_file to avoid another stat call.
+    If the result was already serialized to JSON (e.g. for printing), pass it as serialized to reuse it.
+    """
+    if is_file is None:
+        is_file = _is_file_result(prediction_result)
+    # If it's a file path string, store that. Otherwise, store the direct result.
+    if is_file:
+        return prediction_result
+    # If not a file path, serialize complex objects to a JSON string for DB.
+    # Plain scalars are stored as-is so text outputs don't get wrapped in JSON quotes.
+    if not isinstance(prediction_result, (str, int, float, bool)):
+        if serialized is not None:
+            return serialized
+        try:
+            return _dumps(prediction_result)
+        except Exception as e: # Only reachable for pathological values, e.g. circular references
+            print(f"Warning: Could not serialize prediction result to JSON for DB: {e}. Storing as string.")
+            return str(prediction_result)
+    return prediction_result
+
+def _params_for_db(pos_args: list, kw_args: dict) -> dict:
+    """Returns the parameters dict stored alongside a prediction result."""
+    return kw_args or {f"arg{i}": value for i, value in enumerate(pos_args)}
+
 def handle_run_predict(args):
     """Handles the 'run predict' command."""
     try:
+        space_runner = _lazy_import("space_runner")
+        results_manager = _lazy_import("results_manager")
         print(f"Preparing to run prediction for Space: {args.space_id}, API: {args.api_name}")
         pos_args, kw_args = parse_run_params(args.params)
         
         print(f"Parsed positional params: {pos_args}")
         print(f"Parsed keyword params: {kw_args}")
 
-        hf_token = os.environ.get("HF_TOKEN")
-        prediction_result = space_runner.run_space_predict(args.space_id, args.api_name, *pos_args, **kw_args, hf_token=hf_token)
+        prediction_result = space_runner.run_space_predict(args.space_id, args.api_name, *pos_args, **kw_args, hf_token=_HF_TOKEN)
 
         if prediction_result is not None:
             print("\nPrediction Result:")
             # If result is a file path (string) and exists, indicate it's a file
-            if isinstance(prediction_result, str) and os.path.exists(prediction_result):
+            is_file = _is_file_result(prediction_result)
+            pretty_json = None
+            if is_file:
                  print(f"Output (file): {prediction_result}")
             else:
                 try:
-                    # Try to pretty print if it's JSON-like
-                    print(json.dumps(prediction_result, indent=2))
-                except (TypeError, OverflowError): # Handle non-serializable types if any
+                    # Try to pretty print if it's JSON-like; the same text is saved to the DB below
+                    pretty_json = _dumps_pretty(prediction_result)
+                    print(pretty_json)
+                except (TypeError, ValueError, OverflowError): # Handle non-serializable types if any
                     print(prediction_result)
             
             # Save to results database if output_type_for_db is provided
             if args.output_type_for_db:
                 task_desc_for_db = args.task_desc if args.task_desc else args.space_id
-                # Determine output_data for DB: if it's a file path string, store that. Otherwise, store the direct result.
-                output_data_for_db = prediction_result
-                if not (isinstance(prediction_result, str) and os.path.exists(prediction_result)):
-                    # If not a file path, try to serialize complex objects to string for DB
-                    if not isinstance(prediction_result, (str, int, float, bool)):
-                        try:
-                            output_data_for_db = json.dumps(prediction_result)
-                        except Exception as e:
-                            print(f"Warning: Could not serialize prediction result to JSON for DB: {e}. Storing as string.")
-                            output_data_for_db = str(prediction_result)
+                output_data_for_db = _output_data_for_db(prediction_result, is_file, pretty_json)
                 
                 print(f"\nSaving result to database with output type: {args.output_type_for_db}...")
                 content_id = results_manager.add_content(
@@ -153,7 +270,7 @@ def handle_run_predict(args):
                     task_description=task_desc_for_db,
                     output_type=args.output_type_for_db,
                     output_data=output_data_for_db,
-                    parameters=kw_args if kw_args else dict(zip([f"arg{i}" for i in range(len(pos_args))], pos_args)), # Store params used
+                    parameters=_params_for_db(pos_args, kw_args), # Store params used
                     notes="Generated via CLI 'run predict'"
                 )
                 if content_id:
@@ -165,17 +282,87 @@ def handle_run_predict(args):
     except Exception as e:
         print(f"Error running prediction: {e}")
 
+def handle_run_predict_batch(args):
+    """Handles the 'run predict-batch' command."""
+    try:
+        space_runner = _lazy_import("space_runner")
+        results_manager = _lazy_import("results_manager")
+        print(f"Running predictions from manifest: {args.manifest} (batch size: {args.batch_size})")
+        pending_rows = []
+        saved_count = 0
+        failed_count = 0
+
+        def flush():
+            nonlocal saved_count
+            if not pending_rows:
+                return
+            inserted = results_manager.add_content_many(pending_rows)
+            if inserted is None:
+                print(f"Failed to save {len(pending_rows)} results to database.")
+            else:
+                saved_count += inserted
+            pending_rows.clear()
+
+        with open(args.manifest, 'rb') as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = _loads(line)
+                    space_id = entry['space_id']
+                    api_name = entry['api_name']
+                except (ValueError, KeyError, TypeError) as e:
+                    print(f"Warning: Skipping invalid manifest line {line_no}: {e}")
+                    failed_count += 1
+                    continue
+
+                params = entry.get('params')
+                if params is None or (isinstance(params, list) and all(isinstance(item, str) for item in params)):
+                    pos_args, kw_args = parse_run_params(params)
+                elif isinstance(params, dict):
+                    pos_args, kw_args = [], params # Values are already decoded JSON; passed as keyword arguments
+                else: # e.g. a string, which would otherwise be passed one character per argument
+                    print(f"Warning: Skipping invalid manifest line {line_no}: 'params' must be a list of strings or an object, got {type(params).__name__}")
+                    failed_count += 1
+                    continue
+                try:
+                    prediction_result = space_runner.run_space_predict(space_id, api_name, *pos_args, **kw_args, hf_token=_HF_TOKEN)
+                except Exception as e:
+                    print(f"Error running prediction for line {line_no}: {e}")
+                    failed_count += 1
+                    continue
+                if prediction_result is None:
+                    print(f"Prediction failed for line {line_no} (Space: {space_id}, API: {api_name}).")
+                    failed_count += 1
+                    continue
+
+                pending_rows.append({
+                    'space_id': space_id,
+                    'task_description': entry.get('task_desc') or space_id,
+                    'output_type': entry.get('output_type_for_db') or args.output_type_for_db,
+                    'output_data': _output_data_for_db(prediction_result),
+                    'parameters': _params_for_db(pos_args, kw_args),
+                    'notes': "Generated via CLI 'run predict-batch'"
+                })
+                if len(pending_rows) >= args.batch_size:
+                    flush()
+        flush()
+
+        print(f"Batch complete: {saved_count} results saved, {failed_count} failed.")
+    except Exception as e:
+        print(f"Error running prediction batch: {e}")
+
 def handle_run_submit(args):
     """Handles the 'run submit' command."""
     try:
+        space_runner = _lazy_import("space_runner")
         print(f"Preparing to submit job for Space: {args.space_id}, API: {args.api_name}")
         pos_args, kw_args = parse_run_params(args.params)
 
         print(f"Parsed positional params: {pos_args}")
         print(f"Parsed keyword params: {kw_args}")
 
-        hf_token = os.environ.get("HF_TOKEN")
-        job = space_runner.run_space_submit(args.space_id, args.api_name, *pos_args, **kw_args, hf_token=hf_token)
+        job = space_runner.run_space_submit(args.space_id, args.api_name, *pos_args, **kw_args, hf_token=_HF_TOKEN)
 
         if job:
             # Gradio Job object doesn't have a persistent ID string readily available without internal knowledge.
@@ -189,16 +376,38 @@ def handle_run_submit(args):
         print(f"Error submitting job: {e}")
 
 # --- Results Command Handlers ---
+_ROWS_PER_WRITE = 1000
+
+def _write_content_rows(records, header: str) -> bool:
+    """
+    Writes a line per results_manager.iter_content_summary row to stdout, preceded by header.
+    Lines are buffered and written in chunks of _ROWS_PER_WRITE.
+
+    Returns:
+        True if at least one record was written, False if there were none.
+    """
+    lines = []
+    found = False
+    for record in records:
+        if not found:
+            lines.append(header)
+            found = True
+        content_id, space_id, output_type, task_preview, timestamp = record
+        lines.append(f"  ID: {content_id}, Space: {space_id}, Type: {output_type}, Task: {task_preview}..., Timestamp: {timestamp}")
+        if len(lines) >= _ROWS_PER_WRITE:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+    return found
+
 def handle_results_list(args):
     """Handles the 'results list' command."""
     try:
+        results_manager = _lazy_import("results_manager")
         print(f"Fetching results with limit: {args.limit}, offset: {args.offset}")
-        results = results_manager.get_all_content(limit=args.limit, offset=args.offset)
-        if results:
-            print("Generated Content:")
-            for result in results:
-                 print(f"  ID: {result['id']}, Space: {result['space_id']}, Type: {result['output_type']}, Task: {result['task_description'][:50]}..., Timestamp: {result['timestamp']}")
-        else:
+        records = results_manager.iter_content_summary(limit=args.limit, offset=args.offset)
+        if not _write_content_rows(records, "Generated Content:"):
             print("No results found.")
     except Exception as e:
         print(f"Error listing results: {e}")
@@ -206,12 +415,13 @@ def handle_results_list(args):
 def handle_results_add(args):
     """Handles the 'results add' command."""
     try:
+        results_manager = _lazy_import("results_manager")
         params_dict = {}
         if args.params_json:
             try:
-                params_dict = json.loads(args.params_json)
-            except json.JSONDecodeError:
-                print(f"Error: Invalid JSON string for --params_json: {args.params_json}")
+                params_dict = _loads(args.params_json)
+            except ValueError as e:
+                print(f"Error: Invalid JSON string for --params_json: {args.params_json} ({e})")
                 return
 
         print(f"Adding content: Space ID '{args.space_id}', Task '{args.task}', Type '{args.type}', Data '{args.data[:100]}...'")
@@ -233,11 +443,12 @@ def handle_results_add(args):
 def handle_results_view(args):
     """Handles the 'results view' command."""
     try:
+        results_manager = _lazy_import("results_manager")
         print(f"Fetching result with ID: {args.content_id}")
         result = results_manager.get_content_by_id(args.content_id)
         if result:
             print("Result Details:")
-            print(json.dumps(result, indent=2)) # Pretty print the dictionary
+            print(_dumps_pretty(result)) # Pretty print the dictionary
         else:
             print(f"No result found with ID: {args.content_id}")
     except Exception as e:
@@ -246,19 +457,16 @@ def handle_results_view(args):
 def handle_results_filter(args):
     """Handles the 'results filter' command."""
     try:
+        results_manager = _lazy_import("results_manager")
         print(f"Filtering results by Type: {args.type}, Space ID: {args.space_id}, Task Keyword: {args.task_keyword}, Limit: {args.limit}, Offset: {args.offset}")
-        results = results_manager.filter_content(
+        records = results_manager.iter_content_summary(
+            limit=args.limit,
+            offset=args.offset,
             output_type=args.type,
             space_id=args.space_id,
-            task_keyword=args.task_keyword,
-            limit=args.limit,
-            offset=args.offset
+            task_keyword=args.task_keyword
         )
-        if results:
-            print("Filtered Results:")
-            for res in results:
-                print(f"  ID: {res['id']}, Space: {res['space_id']}, Type: {res['output_type']}, Task: {res['task_description'][:50]}..., Timestamp: {res['timestamp']}")
-        else:
+        if not _write_content_rows(records, "Filtered Results:"):
             print("No results found matching your filter criteria.")
     except Exception as e:
         print(f"Error filtering results: {e}")
@@ -266,6 +474,7 @@ def handle_results_filter(args):
 def handle_results_update(args):
     """Handles the 'results update' command."""
     try:
+        results_manager = _lazy_import("results_manager")
         print(f"Updating notes for result ID: {args.content_id}")
         success = results_manager.update_content_notes(args.content_id, args.notes)
         if success:
@@ -278,10 +487,10 @@ def handle_results_update(args):
 def handle_results_delete(args):
     """Handles the 'results delete' command."""
     try:
+        results_manager = _lazy_import("results_manager")
         print(f"Deleting result with ID: {args.content_id}")
-        # Confirmation prompt
-        confirm = input(f"Are you sure you want to delete result ID {args.content_id}? (yes/no): ")
-        if confirm.lower() == 'yes':
+        # Confirmation prompt, skipped with --yes for scripted use
+        if args.yes or input(f"Are you sure you want to delete result ID {args.content_id}? (yes/no): ").lower() == 'yes':
             success = results_manager.delete_content(args.content_id)
             if success:
                 print(f"Result ID: {args.content_id} deleted successfully.")
@@ -295,24 +504,24 @@ def handle_results_delete(args):
 def handle_results_initdb(args):
     """Handles the 'results initdb' command."""
     try:
+        results_manager = _lazy_import("results_manager")
         results_manager.init_db()
         # The init_db function already prints a success message.
     except Exception as e:
         print(f"Error initializing database: {e}")
 
 
-def main():
-    parser = argparse.ArgumentParser(description="CLI tool for interacting with Hugging Face Spaces and managing results.", formatter_class=argparse.RawTextHelpFormatter)
-    subparsers = parser.add_subparsers(title="commands", dest="command", required=True, help="Available commands")
-
-    # --- Search Command ---
+# --- Argument Parser Builders ---
+def _build_search_parser(subparsers):
+    """Adds the 'search' command parser."""
     search_parser = subparsers.add_parser('search', help='Search for Hugging Face Spaces.')
     search_parser.add_argument('task_description', help='Description of the task to search for.')
     search_parser.add_argument('--sort_by', default='likes', help='Field to sort results by (e.g., likes, updatedAt). Default: likes.')
     search_parser.add_argument('--limit', type=int, default=10, help='Maximum number of results to return. Default: 10.')
     search_parser.set_defaults(func=handle_search_spaces)
 
-    # --- Favorites Command ---
+def _build_favorites_parser(subparsers):
+    """Adds the 'favorites' command parser and its subcommands."""
     favorites_parser = subparsers.add_parser('favorites', help='Manage favorite Spaces.')
     fav_subparsers = favorites_parser.add_subparsers(title="subcommands", dest="fav_subcommand", required=True, help="Favorite management actions")
 
@@ -323,7 +532,8 @@ def main():
     fav_list_parser = fav_subparsers.add_parser('list', help='List favorite Spaces.')
     fav_list_parser.set_defaults(func=handle_favorites_list)
 
-    # --- Run Command ---
+def _build_run_parser(subparsers):
+    """Adds the 'run' command parser and its subcommands."""
     run_parser = subparsers.add_parser('run', help='Run a Hugging Face Space or get API details.')
     run_subparsers = run_parser.add_subparsers(title="subcommands", dest="run_subcommand", required=True, help="Run actions")
 
@@ -339,13 +549,20 @@ def main():
     run_predict_parser.add_argument('--output_type_for_db', help='Optional output type (e.g., text, image_path) for saving the result to the database. If not provided, result is printed but not saved.')
     run_predict_parser.set_defaults(func=handle_run_predict)
 
+    run_batch_parser = run_subparsers.add_parser('predict-batch', help='Run many predictions from a JSONL manifest and save the results in batches.')
+    run_batch_parser.add_argument('--manifest', required=True, help="Path to a JSONL file with one prediction per line, e.g.\n{\"space_id\": \"author/space\", \"api_name\": \"/predict\", \"params\": [\"text=Hello\"], \"task_desc\": \"...\", \"output_type_for_db\": \"text\"}\n'params' is a list of --params style strings, or an object of keyword arguments.")
+    run_batch_parser.add_argument('--output_type_for_db', default='other', help="Output type used for lines that don't set 'output_type_for_db'. Default: other.")
+    run_batch_parser.add_argument('--batch-size', type=_positive_int, default=10000, help='Number of results written to the database per transaction. Default: 10000.')
+    run_batch_parser.set_defaults(func=handle_run_predict_batch)
+
     run_submit_parser = run_subparsers.add_parser('submit', help='Submit a job to a Space asynchronously.')
     run_submit_parser.add_argument('space_id', help='ID of the Space.')
     run_submit_parser.add_argument('api_name', help='API endpoint name.')
     run_submit_parser.add_argument('--params', nargs='+', help="Input parameters, same format as 'run predict'.")
     run_submit_parser.set_defaults(func=handle_run_submit)
 
-    # --- Results Command ---
+def _build_results_parser(subparsers):
+    """Adds the 'results' command parser and its subcommands."""
     results_parser = subparsers.add_parser('results', help='Manage generated results from Spaces.')
     res_subparsers = results_parser.add_subparsers(title="subcommands", dest="res_subcommand", required=True, help="Results management actions")
 
@@ -382,12 +599,34 @@ def main():
 
     res_delete_parser = res_subparsers.add_parser('delete', help='Delete a specific result by ID.')
     res_delete_parser.add_argument('content_id', type=int, help='ID of the content to delete.')
+    res_delete_parser.add_argument('--yes', '-y', action='store_true', help='Delete without asking for confirmation.')
     res_delete_parser.set_defaults(func=handle_results_delete)
 
     res_init_parser = res_subparsers.add_parser('initdb', help='Initialize the results database (creates table if not exists).')
     res_init_parser.set_defaults(func=handle_results_initdb)
 
-    args = parser.parse_args()
+# Only the parser for the command actually invoked needs to be built
+_COMMAND_BUILDERS = {
+    'search': _build_search_parser,
+    'favorites': _build_favorites_parser,
+    'run': _build_run_parser,
+    'results': _build_results_parser,
+}
+
+def main(argv: list[str] | None = None):
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = argparse.ArgumentParser(description="CLI tool for interacting with Hugging Face Spaces and managing results.", formatter_class=argparse.RawTextHelpFormatter)
+    subparsers = parser.add_subparsers(title="commands", dest="command", required=True, help="Available commands")
+
+    builder = _COMMAND_BUILDERS.get(argv[0]) if argv else None
+    if builder:
+        builder(subparsers)
+    else: # Help requested or unknown command: build everything so usage lists all commands
+        for build in _COMMAND_BUILDERS.values():
+            build(subparsers)
+
+    args = parser.parse_args(argv)
     if hasattr(args, 'func'):
         args.func(args)
     else:
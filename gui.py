@@ -2,31 +2,231 @@ import sys
 import os
 import json
 import re # For parsing API details (though less used with structured API)
+import time
+from collections import OrderedDict
+from functools import lru_cache, partial
+
+try:
+    import orjson # Optional: faster decoding/pretty-printing of JSON shown in the detail panes
+except ImportError:
+    orjson = None
+
+if orjson:
+    _json_loads = orjson.loads
+
+    def _json_pretty(obj) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+    def _json_dumps(obj) -> str:
+        """Compact JSON; raises TypeError (orjson.JSONEncodeError) for unserializable values, like json.dumps."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    _json_loads = json.loads
+    _json_pretty = json.JSONEncoder(indent=2, ensure_ascii=False, default=str).encode # One encoder, reused
+    _json_dumps = json.dumps
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QTabWidget, QGroupBox,
-    QLabel, QLineEdit, QComboBox, QSpinBox, QPushButton, QTableWidget,
-    QTableWidgetItem, QListWidget, QListWidgetItem, QHBoxLayout, QMessageBox, QHeaderView,
+    QLabel, QLineEdit, QComboBox, QSpinBox, QPushButton, QTableView, QAbstractItemView,
+    QListView, QHBoxLayout, QMessageBox, QHeaderView,
     QSplitter, QScrollArea, QFormLayout, QFileDialog, QCheckBox, QInputDialog,
-    QMenu, QStackedWidget, QTextEdit, QDoubleSpinBox, QSlider, QColorDialog
+    QMenu, QStackedWidget, QTextEdit, QPlainTextEdit, QDoubleSpinBox, QSlider, QColorDialog
+)
+from PyQt6.QtGui import QPalette, QColor, QAction, QDesktopServices, QPixmap, QPixmapCache, QImage, QImageReader
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QUrl, QSettings, QSize, QTimer, QAbstractTableModel, QModelIndex, QStringListModel,
+    QObject, QRunnable, QThreadPool
 )
-from PyQt6.QtGui import QPalette, QColor, QAction, QDesktopServices, QPixmap
-from PyQt6.QtCore import Qt, pyqtSignal, QUrl, QSettings
 
 # Assuming space_finder.py, space_runner.py, and results_manager.py are in the same directory or accessible
 import space_finder
-import space_runner # For Space Execution tab
+import search_cache # Local cache for repeat Hub searches
 import results_manager # For saving results to DB
-from huggingface_hub import SpaceInfo # For type hinting if needed
-from gradio_client import handle_file # For file parameters
+# space_runner and gradio_client are imported in the Space Execution handlers that use them,
+# so their dependency trees are not loaded before the window is shown
 
-def get_contrasting_text_color(background_color: QColor) -> QColor:
+@lru_cache(maxsize=64)
+def _is_light_rgb(rgb: int) -> bool:
+    """True if the 0xRRGGBB colour is light enough to need dark text. Keyed on an int since QColor isn't hashable."""
     # Calculate luminance (simplified formula)
     # Y = 0.299*R + 0.587*G + 0.114*B
-    luminance = 0.299 * background_color.redF() + \
-                0.587 * background_color.greenF() + \
-                0.114 * background_color.blueF()
-    return QColor(0, 0, 0) if luminance > 0.5 else QColor(255, 255, 255)
+    luminance = (0.299 * ((rgb >> 16) & 0xFF) +
+                 0.587 * ((rgb >> 8) & 0xFF) +
+                 0.114 * (rgb & 0xFF)) / 255
+    return luminance > 0.5
+
+_BLACK = QColor(0, 0, 0)
+_WHITE = QColor(255, 255, 255)
+
+def get_contrasting_text_color(background_color: QColor) -> QColor:
+    """Returns a shared black or white QColor; treat it as read-only (QPalette.setColor and darker() copy it)."""
+    return _BLACK if _is_light_rgb(background_color.rgb() & 0xFFFFFF) else _WHITE
+
+class WorkerSignals(QObject):
+    """Signals emitted by Worker. Created on the GUI thread, so connected slots run there."""
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+class Worker(QRunnable):
+    """Runs fn(*args, **kwargs) on a QThreadPool thread and emits its result (or error message)."""
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+JSON_PRETTY_MAX_CHARS = 2_000_000 # Larger json_data outputs are shown as stored rather than re-indented
+
+def _format_json_output(output_data) -> str:
+    """Returns the indented text for a json_data output. Safe to call off the GUI thread."""
+    if isinstance(output_data, str) and len(output_data) > JSON_PRETTY_MAX_CHARS:
+        return output_data # Building the object tree and re-dumping it would hold both in memory at once
+    try:
+        # Assuming output_data is a string that needs parsing for pretty print
+        # Or it could already be a dict/list if not stored as string
+        if isinstance(output_data, str):
+            return _json_pretty(_json_loads(output_data))
+        if isinstance(output_data, (dict, list)): # If it was already structured
+            return _json_pretty(output_data)
+    except (ValueError, TypeError): # Decode errors are ValueErrors; unserializable values raise TypeError
+        pass
+    return str(output_data) # Show as is if not valid JSON or not structured
+
+def _load_scaled_image(path: str, max_height: int, fast: bool = False) -> QImage:
+    """
+    Decodes an image scaled down to max_height (if taller). Safe to call off the GUI thread.
+    QImageReader decodes straight to the target size, so a large photo is never held at full resolution.
+    With fast=True the decoder's quick, lower-quality scaling is used (for a first preview).
+    Returns a null QImage if the file can't be read as an image.
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True) # Honour EXIF orientation
+    if fast:
+        reader.setQuality(0) # e.g. the JPEG plugin then uses its fast scaled decode
+    size = reader.size() # Read from the header; invalid if the format doesn't report it
+    if max_height > 0 and size.isValid() and size.height() > max_height:
+        ratio = max_height / size.height()
+        reader.setScaledSize(QSize(max(1, int(size.width() * ratio)), max_height))
+    image = reader.read()
+    if not image.isNull() and max_height > 0 and image.height() > max_height: # Size wasn't known up front
+        mode = Qt.TransformationMode.FastTransformation if fast else Qt.TransformationMode.SmoothTransformation
+        image = image.scaledToHeight(max_height, mode)
+    return image
+
+def _space_task_tags(space_info) -> str:
+    task_tags = {} # dict keys: de-duplicates while keeping pipeline_tag first and card tags in order
+    pipeline_tag = getattr(space_info, 'pipeline_tag', None)
+    if pipeline_tag:
+        task_tags[str(pipeline_tag)] = None
+
+    card_data = getattr(space_info, 'cardData', None)
+    if isinstance(card_data, dict):
+        card_tags = card_data.get('tags') or []
+        if isinstance(card_tags, list):
+            task_tags.update(dict.fromkeys(str(t) for t in card_tags if t)) # Ensure t is not None
+
+    return ", ".join(task_tags) or "N/A"
+
+def _row_from_space(space_info) -> tuple[str, str, str, str]:
+    """Display text for one search result row, in SpaceResultsModel.HEADERS order."""
+    return (str(getattr(space_info, 'id', 'N/A')),
+            str(getattr(space_info, 'author', 'N/A')),
+            str(getattr(space_info, 'likes', 0)),
+            _space_task_tags(space_info))
+
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole # Bound once; data() compares against it for every cell and role the views ask for
+
+class _RowListModel(QAbstractTableModel):
+    """
+    Read-only table model over a plain Python list.
+    Rows are exposed to the view in batches of FETCH_BATCH_SIZE as it scrolls (canFetchMore/fetchMore);
+    each row's cell text is built once, as a tuple, when its batch is exposed, so data() is just indexing.
+    """
+    HEADERS = ()
+    FETCH_BATCH_SIZE = 50
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._display_rows = [] # Cell text for the rows exposed so far (the first rowCount() rows)
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._display_rows = [self.display_row(row) for row in self._rows[:self.FETCH_BATCH_SIZE]]
+        self.endResetModel()
+
+    def row_at(self, row: int):
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._display_rows)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._display_rows) < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        fetched = len(self._display_rows)
+        batch = self._rows[fetched:fetched + self.FETCH_BATCH_SIZE]
+        if not batch:
+            return
+        self.beginInsertRows(QModelIndex(), fetched, fetched + len(batch) - 1)
+        self._display_rows.extend(self.display_row(row) for row in batch)
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != _DISPLAY_ROLE or not index.isValid():
+            return None
+        return self._display_rows[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def display_row(self, row) -> tuple:
+        """Returns the text of every cell in row, in HEADERS order."""
+        raise NotImplementedError
+
+class SpaceResultsModel(_RowListModel):
+    """Search results table: one SpaceInfo per row."""
+    HEADERS = ("Space ID", "Author", "Likes", "Task")
+
+    def display_row(self, space_info) -> tuple:
+        return _row_from_space(space_info)
+
+class ResultsLibraryModel(_RowListModel):
+    """Results Library table: one content record dict (without output_data) per row."""
+    HEADERS = ("ID", "Space ID", "Task (Summary)", "Output Type", "Timestamp")
+    TASK_SUMMARY_LEN = 75
+
+    def display_row(self, record) -> tuple:
+        task_desc_full = record.get('task_description')
+        if task_desc_full is None:
+            task_summary = 'N/A'
+        elif len(task_desc_full) > self.TASK_SUMMARY_LEN:
+            task_summary = task_desc_full[:self.TASK_SUMMARY_LEN] + '...'
+        else:
+            task_summary = task_desc_full
+        return (str(record.get('id', 'N/A')),
+                str(record.get('space_id', 'N/A')),
+                task_summary,
+                str(record.get('output_type') or 'N/A'),
+                str(record.get('timestamp') or 'N/A'))
 
 class SpacesUI(QMainWindow):
     def __init__(self):
@@ -38,8 +238,13 @@ class SpacesUI(QMainWindow):
         default_primary_color_hex = "#2a82da" # The original blue
         saved_color_hex = self.settings.value("theme/primaryColor", default_primary_color_hex)
         current_primary_color = QColor(saved_color_hex)
+        self._base_palette = self._build_base_palette() # Dark roles that don't depend on the primary colour
+        self._last_primary_rgb = None # Primary colour of the palette currently applied; see _apply_theme_to_palette
+        self._color_dialog = None # Created by handle_change_theme on first use
         self._apply_theme_to_palette(current_primary_color)
 
+        QPixmapCache.setCacheLimit(64 * 1024) # KB; holds the scaled image previews (see _show_image_async)
+
         # Central widget and layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -49,7 +254,24 @@ class SpacesUI(QMainWindow):
         self.current_selected_space_id = None # From Discovery tab search result
         self.current_results_page = 0
         self.results_per_page = 15
+        self._rl_page_keys = [None] # (timestamp, id) after which each known library page starts
         self.selected_content_id_in_library = None
+        self._current_library_record = None # Cached page record (dict) of the selected library row
+        self._active_workers = set() # Keeps running Worker objects alive until they report back
+        self._search_gen = 0 # Latest search request; results from older searches are discarded
+        self._pending_search_worker = None
+        self._favorites_pool = QThreadPool(self) # One thread, so favorites file writes never interleave
+        self._favorites_pool.setMaxThreadCount(1)
+        self._db_write_pool = QThreadPool(self) # One thread: SQLite takes a single writer, so saves queue up instead of contending
+        self._db_write_pool.setMaxThreadCount(1)
+        self._results_load_seq = 0 # Incremented per library load; stale results are ignored
+        self._full_output_text = {} # output text view -> untruncated text, while a truncated version is shown
+        self._stat_cache = {} # path -> (monotonic time checked, os.stat_result or None); see _stat
+        self._pending_image_for_label = {} # QLabel -> (path, max_h) of the image it is waiting for
+        self._json_pretty_cache = OrderedDict() # content id -> pretty-printed json_data output, most recent last
+        self._json_pretty_cache_chars = 0 # Total length of the cached texts; see _cache_json_pretty
+        self._message_boxes = {} # QMessageBox.Icon -> the box reused for that kind of message; see _message_box
+        self._api_details_cache = {} # space_id -> (monotonic time fetched, api details); see handle_exec_fetch_api
 
         # Attributes for Space Execution Tab
         self.dynamic_input_widgets = {} # Stores {'param_name': {'widget': QWidget, 'type': str, 'label': str, 'component': str}}
@@ -58,6 +280,7 @@ class SpacesUI(QMainWindow):
         self.current_selected_endpoint_name_exec = None
         self.current_exec_output_data = None
         self.current_exec_output_type = None
+        self.current_exec_run_context = None # (space_id, parameters dict, task description) that produced current_exec_output_data
 
         # Tab widget for main sections
         self.tab_widget = QTabWidget()
@@ -71,12 +294,17 @@ class SpacesUI(QMainWindow):
         # --- Space Execution Tab ---
         self.space_execution_gb = QGroupBox("Space Execution")
         self.tab_widget.addTab(self.space_execution_gb, "Space Execution")
-        self.init_space_execution_tab()
 
         # --- Results Library Tab ---
         self.results_library_gb = QGroupBox("Results Library")
         self.tab_widget.addTab(self.results_library_gb, "Results Library")
-        self.init_results_library_tab()
+
+        # The Execution and Library tabs are populated the first time they are shown; see _on_tab_changed
+        self._pending_tab_inits = {
+            self.space_execution_gb: self.init_space_execution_tab,
+            self.results_library_gb: self.init_results_library_tab,
+        }
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         # Add "Settings" menu
         menu_bar = self.menuBar()
@@ -86,7 +314,141 @@ class SpacesUI(QMainWindow):
         change_theme_action.triggered.connect(self.handle_change_theme)
         settings_menu.addAction(change_theme_action)
 
-    def _apply_theme_to_palette(self, primary_color: QColor):
+    def _on_tab_changed(self, index):
+        init_tab = self._pending_tab_inits.pop(self.tab_widget.widget(index), None)
+        if init_tab is not None:
+            init_tab()
+
+    def _start_worker(self, fn, *args, on_finished=None, on_error=None, pool=None, **kwargs):
+        """
+        Runs fn(*args, **kwargs) on pool (default: the global QThreadPool).
+        on_finished/on_error are called on the GUI thread.
+        """
+        worker = Worker(fn, *args, **kwargs)
+        worker.setAutoDelete(False)
+        self._active_workers.add(worker)
+        worker.signals.finished.connect(lambda _result: self._active_workers.discard(worker))
+        worker.signals.error.connect(lambda _message: self._active_workers.discard(worker))
+        if on_finished:
+            worker.signals.finished.connect(on_finished)
+        if on_error:
+            worker.signals.error.connect(on_error)
+        (pool or QThreadPool.globalInstance()).start(worker)
+        return worker
+
+    MAX_DISPLAY_CHARS = 256 * 1024 # Longer outputs are truncated until "Load Full Output" is clicked
+
+    def _message_box(self, icon, title: str, text: str,
+                     buttons=QMessageBox.StandardButton.Ok) -> QMessageBox.StandardButton:
+        """
+        Shows a modal message and returns the button pressed. One QMessageBox per icon is created on first use and reused.
+        Worker callbacks can report while a box is still open; that case gets a throwaway box instead.
+        """
+        box = self._message_boxes.get(icon)
+        if box is None:
+            box = QMessageBox(self)
+            box.setIcon(icon)
+            self._message_boxes[icon] = box
+        elif box.isVisible(): # Reusing it would overwrite the shown message and make exec() return at once
+            box = QMessageBox(icon, title, text, buttons, self)
+            box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+            return QMessageBox.StandardButton(box.exec())
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(buttons)
+        return QMessageBox.StandardButton(box.exec())
+
+    def _build_output_text_page(self):
+        """Builds an output stack's text page: a read-only QPlainTextEdit plus a hidden "Load Full Output" button."""
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        view = QPlainTextEdit() # Plain-text line layout; much cheaper than QTextEdit for large outputs
+        view.setReadOnly(True)
+        load_full_button = QPushButton("Load Full Output")
+        load_full_button.setVisible(False)
+        load_full_button.clicked.connect(lambda: self._load_full_output_text(view, load_full_button))
+        layout.addWidget(view)
+        layout.addWidget(load_full_button)
+        return page, view, load_full_button
+
+    def _set_output_text(self, view, load_full_button, text):
+        """Shows text in view, truncated to MAX_DISPLAY_CHARS so huge outputs don't stall layout."""
+        text = str(text)
+        if len(text) > self.MAX_DISPLAY_CHARS:
+            self._full_output_text[view] = text
+            view.setPlainText(text[:self.MAX_DISPLAY_CHARS] + "\n… [truncated]")
+            load_full_button.setVisible(True)
+        else:
+            self._full_output_text.pop(view, None)
+            view.setPlainText(text)
+            load_full_button.setVisible(False)
+
+    def _load_full_output_text(self, view, load_full_button):
+        full_text = self._full_output_text.pop(view, None)
+        if full_text is not None:
+            view.setPlainText(full_text)
+        load_full_button.setVisible(False)
+
+    STAT_CACHE_TTL = 2.0 # Seconds an os.stat result is reused
+
+    def _stat(self, path: str):
+        """os.stat with a short-lived cache; returns None if the file is missing, so one call answers exists and mtime."""
+        now = time.monotonic()
+        cached = self._stat_cache.get(path)
+        if cached is not None and now - cached[0] < self.STAT_CACHE_TTL:
+            return cached[1]
+        try:
+            stat_result = os.stat(path)
+        except OSError: # FileNotFoundError, or a path that can't be a file at all
+            stat_result = None
+        if len(self._stat_cache) > 256: # Bounded: entries are only useful for a couple of seconds anyway
+            self._stat_cache.clear()
+        self._stat_cache[path] = (now, stat_result)
+        return stat_result
+
+    def _show_image_async(self, label: QLabel, path: str, max_h: int, stat_result=None):
+        """Decodes and scales the image on a worker, then shows it in label unless a newer image was requested."""
+        if stat_result is None:
+            stat_result = self._stat(path)
+        mtime = stat_result.st_mtime if stat_result is not None else 0.0
+        request = (path, max_h)
+        self._pending_image_for_label[label] = request
+
+        # Scaled previews live in Qt's global pixmap cache; mtime in the key drops stale entries for overwritten files
+        cache_key = f"{path}:{mtime}:{max_h}"
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None and not pixmap.isNull():
+            label.setPixmap(pixmap)
+            return
+        label.setText("Loading image...")
+
+        # Two passes: a quick low-quality preview first, then the smooth-scaled one that gets cached
+        def on_fast_finished(image):
+            if self._pending_image_for_label.get(label) != request: # Superseded by another selection
+                return
+            if image.isNull():
+                label.setText(f"Error loading image (or not an image):\n{path}")
+                return
+            label.setPixmap(QPixmap.fromImage(image))
+            self._start_worker(_load_scaled_image, path, max_h, on_finished=on_smooth_finished, on_error=on_error)
+
+        def on_smooth_finished(image):
+            if image.isNull():
+                return
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(cache_key, pixmap)
+            if self._pending_image_for_label.get(label) == request:
+                label.setPixmap(pixmap)
+
+        def on_error(error_message):
+            if self._pending_image_for_label.get(label) == request:
+                label.setText(f"Error loading image:\n{path}\n{error_message}")
+
+        self._start_worker(_load_scaled_image, path, max_h, True, on_finished=on_fast_finished, on_error=on_error)
+
+    @staticmethod
+    def _build_base_palette() -> QPalette:
         palette = QPalette()
         
         # Define base dark theme colors
@@ -101,39 +463,53 @@ class SpacesUI(QMainWindow):
         palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 220)) # Light yellow for tooltips
         palette.setColor(QPalette.ColorRole.ToolTipText, QColor(0,0,0)) # Black text for tooltips
         palette.setColor(QPalette.ColorRole.Text, dark_text_color)
+        palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0)) # Keep for errors or important alerts
+        return palette
+
+    def _apply_theme_to_palette(self, primary_color: QColor):
+        if primary_color.rgb() == self._last_primary_rgb: # Already applied; avoid an application-wide restyle
+            return
+        self._last_primary_rgb = primary_color.rgb()
+        palette = QPalette(self._base_palette) # Copy; only the primary-colour roles are set below
         
         # Use primary_color for actionable items
         button_text_color = get_contrasting_text_color(primary_color)
         palette.setColor(QPalette.ColorRole.Button, primary_color)
         palette.setColor(QPalette.ColorRole.ButtonText, button_text_color)
-        
-        palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0)) # Keep for errors or important alerts
         palette.setColor(QPalette.ColorRole.Link, primary_color)
         
         palette.setColor(QPalette.ColorRole.Highlight, primary_color)
-        palette.setColor(QPalette.ColorRole.HighlightedText, get_contrasting_text_color(primary_color))
+        palette.setColor(QPalette.ColorRole.HighlightedText, button_text_color)
 
         # Ensure disabled states are visible
         disabled_button_color = primary_color.darker(130) # Make it look grayed out a bit
-        # Ensure disabled_text_color is QColor
         base_disabled_text_color = get_contrasting_text_color(disabled_button_color) 
+        # Adjust based on its own lightness
+        disabled_text_color = base_disabled_text_color.darker(110) if base_disabled_text_color.lightnessF() > 0.5 else base_disabled_text_color.lighter(110)
         palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Button, disabled_button_color)
         palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, base_disabled_text_color)
-        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, base_disabled_text_color.darker(110) if base_disabled_text_color.lightnessF() > 0.5 else base_disabled_text_color.lighter(110)) # Adjust based on its own lightness
-        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText, base_disabled_text_color.darker(110) if base_disabled_text_color.lightnessF() > 0.5 else base_disabled_text_color.lighter(110))
+        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, disabled_text_color)
+        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText, disabled_text_color)
 
-
-        self.setPalette(palette)
-        # Also set for the entire application to ensure dialogs, etc., are themed
+        # Set for the entire application so dialogs etc. are themed too; widgets inherit it,
+        # so setting it on the window as well would only trigger a second palette propagation
         app = QApplication.instance()
         if app:
             app.setPalette(palette)
+        else:
+            self.setPalette(palette)
 
     def handle_change_theme(self):
         current_color_hex = self.settings.value("theme/primaryColor", "#2a82da")
         initial_color = QColor(current_color_hex)
         
-        new_color = QColorDialog.getColor(initial_color, self, "Select Primary Theme Color")
+        if self._color_dialog is None: # Built on first use and kept, so later opens skip building the dialog
+            self._color_dialog = QColorDialog(self)
+            self._color_dialog.setWindowTitle("Select Primary Theme Color")
+        self._color_dialog.setCurrentColor(initial_color)
+        if not self._color_dialog.exec(): # Cancelled
+            return
+        new_color = self._color_dialog.selectedColor()
         
         if new_color.isValid():
             self.settings.setValue("theme/primaryColor", new_color.name())
@@ -165,20 +541,29 @@ class SpacesUI(QMainWindow):
         # Search Results Section
         results_section_gb = QGroupBox("Search Results")
         results_layout = QVBoxLayout(results_section_gb) # Corrected: Set layout on the GroupBox
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(4)
-        self.results_table.setHorizontalHeaderLabels(["Space ID", "Author", "Likes", "Task"])
-        self.results_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.results_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.results_table.itemSelectionChanged.connect(self.handle_search_result_selection)
-        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive) # Allow Space ID to be resized
+        self.search_results_model = SpaceResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.search_results_model)
+        self.results_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.results_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.results_table.selectionModel().selectionChanged.connect(self.handle_search_result_selection)
+        # Fixed starting widths: sizing to contents would measure every cell after each search
+        search_header = self.results_table.horizontalHeader()
+        search_header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        search_header.resizeSection(0, 240) # Space ID
+        search_header.resizeSection(1, 120) # Author
+        search_header.resizeSection(2, 60) # Likes
+        search_header.setStretchLastSection(True) # Task
         results_layout.addWidget(self.results_table)
         discovery_layout.addWidget(results_section_gb)
 
         # Favorites Section
-        self.favorites_list_widget = QListWidget()
+        self.favorites_model = QStringListModel(self)
+        self._favorites_placeholder_shown = False # True when the list shows a message rather than Space IDs
+        self.favorites_list_view = QListView()
+        self.favorites_list_view.setModel(self.favorites_model)
+        self.favorites_list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.add_to_fav_button = QPushButton("Add Search Result to Favorites")
         self.add_to_fav_button.setEnabled(False)
         self.remove_fav_button = QPushButton("Remove Selected Favorite") # Renamed for clarity
@@ -186,7 +571,7 @@ class SpacesUI(QMainWindow):
 
         favorites_section_gb = QGroupBox("Favorite Spaces")
         favorites_layout = QVBoxLayout(favorites_section_gb)
-        favorites_layout.addWidget(self.favorites_list_widget)
+        favorites_layout.addWidget(self.favorites_list_view)
         fav_buttons_layout = QHBoxLayout()
         fav_buttons_layout.addWidget(self.add_to_fav_button)
         fav_buttons_layout.addWidget(self.remove_fav_button)
@@ -197,6 +582,11 @@ class SpacesUI(QMainWindow):
         self.add_to_fav_button.clicked.connect(self.handle_add_to_favorites)
         self.remove_fav_button.clicked.connect(self.handle_remove_favorite)
         self.refresh_fav_button.clicked.connect(self.refresh_favorites_list)
+
+        self._favorites_refresh_debounce = QTimer(self) # Coalesces re-reads of the favorites file after quick add/remove runs
+        self._favorites_refresh_debounce.setSingleShot(True)
+        self._favorites_refresh_debounce.setInterval(30)
+        self._favorites_refresh_debounce.timeout.connect(self.refresh_favorites_list)
         
         self.refresh_favorites_list() # Initial population
 
@@ -206,110 +596,109 @@ class SpacesUI(QMainWindow):
         limit = self.limit_spinbox.value()
 
         if not task:
-            QMessageBox.warning(self, "Search Error", "Task description cannot be empty.")
+            self._message_box(QMessageBox.Icon.Warning, "Search Error", "Task description cannot be empty.")
             return
 
+        self._search_gen += 1
+        gen = self._search_gen
+        # A search still queued behind busy pool threads is superseded; drop it before it hits the Hub
+        previous = self._pending_search_worker
+        if previous is not None and QThreadPool.globalInstance().tryTake(previous):
+            self._active_workers.discard(previous)
+
+        self.search_button.setText("Searching...")
+        # Repeat searches are served from the local cache; misses hit the Hub on the worker thread
+        self._pending_search_worker = self._start_worker(
+            search_cache.cached_find_spaces, task, sort_by, limit,
+            on_finished=lambda spaces: self._on_search_finished(spaces, gen),
+            on_error=lambda error_message: self._on_search_error(error_message, gen)
+        )
+
+    def _on_search_finished(self, spaces, gen):
+        if gen != self._search_gen: # A newer search was started; keep its results instead
+            return
+        self._pending_search_worker = None
+        self.search_button.setText("Search Spaces")
         try:
-            self.search_button.setEnabled(False)
-            self.search_button.setText("Searching...")
-            QApplication.processEvents() 
-
-            spaces = space_finder.find_spaces(task_description=task, sort_by=sort_by, limit=limit)
-            self.results_table.setRowCount(0) 
+            self.search_results_model.set_rows(spaces)
+            self.handle_search_result_selection() # Model reset clears the selection without emitting selectionChanged
 
             if not spaces:
-                QMessageBox.information(self, "No Results", "No spaces found for your query.")
-                return
-
-            for row, space_info in enumerate(spaces):
-                self.results_table.insertRow(row)
-                space_id = getattr(space_info, 'id', 'N/A')
-                author = getattr(space_info, 'author', 'N/A')
-                likes = getattr(space_info, 'likes', 0)
-                
-                task_tags_list = []
-                if hasattr(space_info, 'pipeline_tag') and space_info.pipeline_tag:
-                    task_tags_list.append(str(space_info.pipeline_tag))
-                
-                if hasattr(space_info, 'cardData') and isinstance(space_info.cardData, dict):
-                    card_tags = space_info.cardData.get('tags', [])
-                    if isinstance(card_tags, list):
-                        task_tags_list.extend([str(t) for t in card_tags if t]) # Ensure t is not None
-                
-                task_tags_str = ", ".join(list(set(task_tags_list))) if task_tags_list else "N/A"
-
-                self.results_table.setItem(row, 0, QTableWidgetItem(str(space_id)))
-                self.results_table.setItem(row, 1, QTableWidgetItem(str(author)))
-                self.results_table.setItem(row, 2, QTableWidgetItem(str(likes)))
-                self.results_table.setItem(row, 3, QTableWidgetItem(task_tags_str))
-            
-            self.results_table.resizeColumnsToContents()
-            self.results_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
-
-
+                self._message_box(QMessageBox.Icon.Information, "No Results", "No spaces found for your query.")
         except Exception as e:
-            QMessageBox.critical(self, "Search Failed", f"An error occurred during search: {e}")
-        finally:
-            self.search_button.setEnabled(True)
-            self.search_button.setText("Search Spaces")
+            self._message_box(QMessageBox.Icon.Critical, "Search Failed", f"An error occurred during search: {e}")
+
+    def _on_search_error(self, error_message, gen):
+        if gen != self._search_gen:
+            return
+        self._pending_search_worker = None
+        self.search_button.setText("Search Spaces")
+        self._message_box(QMessageBox.Icon.Critical, "Search Failed", f"An error occurred during search: {error_message}")
 
     def handle_search_result_selection(self):
         selected_rows = self.results_table.selectionModel().selectedRows()
         if selected_rows:
-            self.current_selected_space_id = self.results_table.item(selected_rows[0].row(), 0).text()
+            self.current_selected_space_id = self.search_results_model.index(selected_rows[0].row(), 0).data()
             self.add_to_fav_button.setEnabled(True)
         else:
             self.current_selected_space_id = None
             self.add_to_fav_button.setEnabled(False)
 
     def refresh_favorites_list(self):
-        self.favorites_list_widget.clear()
         try:
             fav_ids = space_finder.get_favorite_spaces()
-            if fav_ids:
-                self.favorites_list_widget.addItems(fav_ids)
-            else:
-                placeholder_item = QListWidgetItem("No favorites yet.")
-                placeholder_item.setData(Qt.ItemDataRole.UserRole, "placeholder")
-                self.favorites_list_widget.addItem(placeholder_item)
+            self._favorites_placeholder_shown = not fav_ids
+            new_list = fav_ids or ["No favorites yet."]
+            if new_list != self.favorites_model.stringList(): # Unchanged: skip the reset, keeping the selection
+                self.favorites_model.setStringList(new_list)
         except Exception as e:
-            QMessageBox.warning(self, "Favorites Error", f"Could not load favorites: {e}")
-            error_item = QListWidgetItem("Error loading favorites.")
-            error_item.setData(Qt.ItemDataRole.UserRole, "placeholder")
-            self.favorites_list_widget.addItem(error_item)
+            self._message_box(QMessageBox.Icon.Warning, "Favorites Error", f"Could not load favorites: {e}")
+            self._favorites_placeholder_shown = True
+            self.favorites_model.setStringList(["Error loading favorites."])
 
     def handle_add_to_favorites(self):
         if not self.current_selected_space_id:
-            QMessageBox.warning(self, "Add Favorite Error", "No space selected from search results.")
+            self._message_box(QMessageBox.Icon.Warning, "Add Favorite Error", "No space selected from search results.")
             return
         
-        try:
-            space_finder.add_to_favorites(self.current_selected_space_id)
-            self.refresh_favorites_list() 
-            if hasattr(self, 'exec_load_fav_button'): # Check if exec tab is initialized
-                 self.exec_load_fav_button.setToolTip("Favorites updated. Click to refresh list in dialog.")
-        except Exception as e:
-            QMessageBox.critical(self, "Add Favorite Failed", f"Could not add favorite: {e}")
+        self.add_to_fav_button.setEnabled(False)
+        self._start_worker(space_finder.add_to_favorites, self.current_selected_space_id,
+                           on_finished=self._on_favorite_added, on_error=self._on_add_favorite_error,
+                           pool=self._favorites_pool)
+
+    def _on_favorite_added(self, _result):
+        self.add_to_fav_button.setEnabled(self.current_selected_space_id is not None)
+        self._favorites_refresh_debounce.start()
+        if hasattr(self, 'exec_load_fav_button'): # Check if exec tab is initialized
+             self.exec_load_fav_button.setToolTip("Favorites updated. Click to refresh list in dialog.")
+
+    def _on_add_favorite_error(self, error_message):
+        self.add_to_fav_button.setEnabled(self.current_selected_space_id is not None)
+        self._message_box(QMessageBox.Icon.Critical, "Add Favorite Failed", f"Could not add favorite: {error_message}")
 
     def handle_remove_favorite(self):
-        selected_item = self.favorites_list_widget.currentItem()
-        if not selected_item or selected_item.data(Qt.ItemDataRole.UserRole) == "placeholder":
-            QMessageBox.warning(self, "Remove Favorite Error", "Please select a valid favorite to remove.")
+        current_index = self.favorites_list_view.currentIndex()
+        if not current_index.isValid() or self._favorites_placeholder_shown:
+            self._message_box(QMessageBox.Icon.Warning, "Remove Favorite Error", "Please select a valid favorite to remove.")
             return
         
-        space_id_to_remove = selected_item.text()
-        confirm = QMessageBox.question(self, "Confirm Removal", 
-                                       f"Are you sure you want to remove '{space_id_to_remove}' from favorites?",
-                                       QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        space_id_to_remove = current_index.data()
+        confirm = self._message_box(QMessageBox.Icon.Question, "Confirm Removal",
+                                    f"Are you sure you want to remove '{space_id_to_remove}' from favorites?",
+                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         
         if confirm == QMessageBox.StandardButton.Yes:
-            try:
-                space_finder.remove_from_favorites(space_id_to_remove)
-                self.refresh_favorites_list() 
-                if hasattr(self, 'exec_load_fav_button'):
-                    self.exec_load_fav_button.setToolTip("Favorites updated. Click to refresh list in dialog.")
-            except Exception as e:
-                QMessageBox.critical(self, "Remove Favorite Failed", f"Could not remove favorite: {e}")
+            # Queued behind any pending add so the read-modify-write of the favorites file stays ordered
+            self._start_worker(space_finder.remove_from_favorites, space_id_to_remove,
+                               on_finished=self._on_favorite_removed,
+                               on_error=lambda error_message: self._message_box(
+                                   QMessageBox.Icon.Critical, "Remove Favorite Failed", f"Could not remove favorite: {error_message}"),
+                               pool=self._favorites_pool)
+
+    def _on_favorite_removed(self, _result):
+        self._favorites_refresh_debounce.start()
+        if hasattr(self, 'exec_load_fav_button'):
+            self.exec_load_fav_button.setToolTip("Favorites updated. Click to refresh list in dialog.")
 
     # --- Space Execution Tab ---
     def init_space_execution_tab(self):
@@ -383,9 +772,8 @@ class SpacesUI(QMainWindow):
         exec_placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.exec_output_stack.addWidget(exec_placeholder_label)
         # Page 1: Text
-        self.exec_output_text_view = QTextEdit()
-        self.exec_output_text_view.setReadOnly(True)
-        self.exec_output_stack.addWidget(self.exec_output_text_view)
+        self.exec_output_text_page, self.exec_output_text_view, self.exec_output_load_full_button = self._build_output_text_page()
+        self.exec_output_stack.addWidget(self.exec_output_text_page)
         # Page 2: Image
         self.exec_output_image_scroll = QScrollArea()
         self.exec_output_image_scroll.setWidgetResizable(True)
@@ -397,6 +785,8 @@ class SpacesUI(QMainWindow):
         self.exec_output_file_button_widget = QWidget()
         exec_file_button_layout = QVBoxLayout(self.exec_output_file_button_widget)
         self.exec_output_file_button = QPushButton("Open File/Media")
+        self._exec_output_target = None # (path_or_url, is_url, QUrl or None) opened by exec_output_file_button
+        self.exec_output_file_button.clicked.connect(self._open_exec_output)
         exec_file_button_layout.addWidget(self.exec_output_file_button)
         exec_file_button_layout.addStretch()
         self.exec_output_stack.addWidget(self.exec_output_file_button_widget)
@@ -413,7 +803,7 @@ class SpacesUI(QMainWindow):
     def handle_exec_load_favorite(self):
         fav_ids = space_finder.get_favorite_spaces()
         if not fav_ids:
-            QMessageBox.information(self, "No Favorites", "You have no saved favorites.")
+            self._message_box(QMessageBox.Icon.Information, "No Favorites", "You have no saved favorites.")
             return
 
         space_id, ok = QInputDialog.getItem(self, "Select Favorite Space", 
@@ -422,20 +812,41 @@ class SpacesUI(QMainWindow):
             self.exec_space_id_input.setText(space_id)
             self.handle_exec_fetch_api() # Optionally auto-fetch
 
+    API_DETAILS_CACHE_TTL = 300 # Seconds fetched API details are reused for the same Space
+
     def handle_exec_fetch_api(self):
         space_id = self.exec_space_id_input.text().strip()
         if not space_id:
-            QMessageBox.warning(self, "API Load Error", "Please enter a Space ID.")
+            self._message_box(QMessageBox.Icon.Warning, "API Load Error", "Please enter a Space ID.")
+            return
+
+        # Fetching the Space that is already loaded again is treated as a refresh and skips the cache
+        cached = self._api_details_cache.get(space_id)
+        if (cached is not None and space_id != self.current_loaded_space_id_exec
+                and time.monotonic() - cached[0] < self.API_DETAILS_CACHE_TTL):
+            self._on_exec_api_loaded(space_id, cached[1])
             return
 
         self.exec_fetch_api_button.setText("Fetching...")
         self.exec_fetch_api_button.setEnabled(False)
-        QApplication.processEvents()
-
+        self._start_worker(self._fetch_space_api_details, space_id,
+                           on_finished=lambda api_details: self._on_exec_api_fetched(space_id, api_details),
+                           on_error=self._on_exec_api_error)
+
+    def _on_exec_api_fetched(self, space_id, api_details):
+        if api_details: # Failed lookups aren't cached, so a retry goes back to the network
+            self._api_details_cache[space_id] = (time.monotonic(), api_details)
+        self._on_exec_api_loaded(space_id, api_details)
+
+    @staticmethod
+    def _fetch_space_api_details(space_id):
+        # This function needs to be implemented in space_runner.py
+        # It should return a dict similar to what gradio_client.Client.view_api() provides
+        import space_runner # Deferred until the Execution tab is first used
+        return space_runner.get_space_api_details(space_id)
+
+    def _on_exec_api_loaded(self, space_id, api_details):
         try:
-            # This function needs to be implemented in space_runner.py
-            # It should return a dict similar to what gradio_client.Client.view_api() provides
-            api_details = space_runner.get_space_api_details(space_id) 
             if api_details:
                 self.current_loaded_space_id_exec = space_id
                 self.current_loaded_api_details_exec = api_details
@@ -444,35 +855,35 @@ class SpacesUI(QMainWindow):
                 # Update task description based on space (e.g. from cardData if available)
                 # For simplicity, this is manual for now via self.exec_task_desc_input
             else:
-                QMessageBox.critical(self, "API Load Failed", f"Could not fetch API details for '{space_id}'. Check Space ID and network.")
+                self._message_box(QMessageBox.Icon.Critical, "API Load Failed", f"Could not fetch API details for '{space_id}'. Check Space ID and network.")
                 self.current_loaded_api_details_exec = None
                 self.exec_run_button.setEnabled(False)
                 self.exec_api_endpoint_label.setText("API Endpoint: Load failed")
         except Exception as e:
-            QMessageBox.critical(self, "API Load Error", f"An error occurred: {e}")
-            self.current_loaded_api_details_exec = None
-            self.exec_run_button.setEnabled(False)
-            self.exec_api_endpoint_label.setText("API Endpoint: Error")
+            self._on_exec_api_error(str(e))
         finally:
             self.exec_fetch_api_button.setText("Fetch API Details")
             self.exec_fetch_api_button.setEnabled(True)
-            
-    def _clear_layout(self, layout):
-        if layout is not None:
-            while layout.count():
-                item = layout.takeAt(0)
-                widget = item.widget()
-                if widget is not None:
-                    widget.deleteLater()
-                else:
-                    sub_layout = item.layout()
-                    if sub_layout is not None:
-                        self._clear_layout(sub_layout)
-                        sub_layout.deleteLater()
 
+    def _on_exec_api_error(self, error_message):
+        self._message_box(QMessageBox.Icon.Critical, "API Load Error", f"An error occurred: {error_message}")
+        self.current_loaded_api_details_exec = None
+        self.exec_run_button.setEnabled(False)
+        self.exec_api_endpoint_label.setText("API Endpoint: Error")
+        self.exec_fetch_api_button.setText("Fetch API Details")
+        self.exec_fetch_api_button.setEnabled(True)
+
+    def _reset_exec_params_widget(self):
+        """Replaces the parameter form with an empty one; the old container and its rows go in one deferred deletion."""
+        old_widget = self.exec_params_scroll_area.takeWidget()
+        if old_widget is not None:
+            old_widget.deleteLater()
+        self.exec_params_widget = QWidget() # Container for form layout
+        self.exec_params_form_layout = QFormLayout(self.exec_params_widget)
+        self.exec_params_scroll_area.setWidget(self.exec_params_widget)
 
     def populate_execution_inputs(self, api_details):
-        self._clear_layout(self.exec_params_form_layout) # Clear previous dynamic widgets
+        self._reset_exec_params_widget() # Clear previous dynamic widgets
         self.dynamic_input_widgets.clear()
 
         if not api_details or not api_details.get("named_endpoints"):
@@ -496,81 +907,12 @@ class SpacesUI(QMainWindow):
             # 'component' is also available. Let's prioritize 'component' then 'type'.
             actual_type = param.get("type", "textbox").lower() # e.g. "textbox", "number", "checkbox"
             
-            widget = None
             param_info = {'widget': None, 'type': actual_type, 'label': label_text, 'component': component_type, 'name': param_name}
 
-            if component_type in ["textbox", "text"] or actual_type in ["textbox", "text"]:
-                # Check for multiline text
-                if param.get("lines", 1) > 1:
-                    widget = QTextEdit()
-                    widget.setPlaceholderText(param.get("info", label_text))
-                    widget.setMaximumHeight(80)
-                else:
-                    widget = QLineEdit()
-                    widget.setPlaceholderText(param.get("info", label_text))
-                default_value = param.get("value")
-                if default_value is not None:
-                    if isinstance(widget, QTextEdit): widget.setPlainText(str(default_value))
-                    else: widget.setText(str(default_value))
-
-            elif component_type == "number" or actual_type == "number":
-                widget = QDoubleSpinBox()
-                py_type = param.get("python_type", {}).get("type", "float")
-                if py_type == "int":
-                    widget = QSpinBox() # Use QSpinBox for integers
-                    widget.setRange(int(param.get("minimum", -1000000)), int(param.get("maximum", 1000000)))
-                else: # float
-                    widget.setRange(param.get("minimum", -1000000.0), param.get("maximum", 1000000.0))
-                    widget.setDecimals(param.get("precision", 2))
-                
-                default_value = param.get("value")
-                if default_value is not None: widget.setValue(float(default_value))
-
-
-            elif component_type == "slider" or actual_type == "slider":
-                widget = QSlider(Qt.Orientation.Horizontal)
-                widget.setRange(int(param.get("minimum", 0)), int(param.get("maximum", 100)))
-                widget.setValue(int(param.get("value", param.get("minimum", 0))))
-                # TODO: Add a QLabel to show current slider value if desired
-
-            elif component_type == "checkbox" or actual_type == "checkbox":
-                widget = QCheckBox(label_text) # Label is part of checkbox
-                label_text = "" # No separate label needed for QFormLayout
-                default_value = param.get("value")
-                if default_value is not None: widget.setChecked(bool(default_value))
-            
-            elif component_type in ["dropdown", "radio"] or actual_type in ["dropdown", "radio"]:
-                widget = QComboBox()
-                choices = param.get("choices", [])
-                if choices: widget.addItems([str(c) for c in choices])
-                default_value = param.get("value")
-                if default_value is not None: widget.setCurrentText(str(default_value))
-
-            elif component_type in ["image", "audio", "video", "file", "uploadbutton"] or \
-                 actual_type in ["image", "audio", "video", "file", "uploadbutton"]:
-                file_input_widget = QWidget()
-                file_input_layout = QHBoxLayout(file_input_widget)
-                file_input_layout.setContentsMargins(0,0,0,0)
-                
-                file_label = QLabel("No file selected.")
-                file_button = QPushButton("Browse...")
-                
-                # Use a unique object name for the label to retrieve it later
-                file_label_obj_name = f"file_label_for_{param_name}"
-                file_label.setObjectName(file_label_obj_name)
-
-                file_button.clicked.connect(lambda checked=False, p_name=param_name, lbl_obj_name=file_label_obj_name: self.handle_exec_browse_file(p_name, lbl_obj_name))
-                
-                file_input_layout.addWidget(file_label, 1) # Give label more space
-                file_input_layout.addWidget(file_button)
-                widget = file_input_widget
-                param_info['type'] = 'filepath' # Special handling for file types
-                param_info['file_label_obj_name'] = file_label_obj_name # Store for value retrieval
-
-            else: # Fallback for unknown types
-                widget = QLineEdit()
-                widget.setPlaceholderText(f"Unsupported type: {component_type} / {actual_type}")
-                widget.setEnabled(False)
+            # Where component and type name different widgets, the earlier entry in _PARAM_WIDGET_KINDS wins
+            kinds = [kind for kind in (self._PARAM_WIDGET_KINDS.get(component_type), self._PARAM_WIDGET_KINDS.get(actual_type)) if kind]
+            make_widget = min(kinds, key=lambda kind: kind[0])[1] if kinds else SpacesUI._make_unsupported_input
+            widget, label_text = make_widget(self, param, param_info)
 
             if widget:
                 param_info['widget'] = widget
@@ -582,104 +924,184 @@ class SpacesUI(QMainWindow):
         
         self.exec_params_widget.adjustSize() # Adjust size of container for scrollbar if needed
 
-    def handle_exec_browse_file(self, param_name_key, file_label_obj_name):
-        # Find the QLabel associated with this file input
-        file_label_widget = self.exec_params_widget.findChild(QLabel, file_label_obj_name)
-        if not file_label_widget:
-            print(f"Error: Could not find file label for {param_name_key}")
+    def _make_text_input(self, param, param_info):
+        label_text = param_info['label']
+        # Check for multiline text
+        if param.get("lines", 1) > 1:
+            widget = QTextEdit()
+            widget.setPlaceholderText(param.get("info", label_text))
+            widget.setMaximumHeight(80)
+        else:
+            widget = QLineEdit()
+            widget.setPlaceholderText(param.get("info", label_text))
+        default_value = param.get("value")
+        if default_value is not None:
+            if isinstance(widget, QTextEdit): widget.setPlainText(str(default_value))
+            else: widget.setText(str(default_value))
+        param_info['getter'] = widget.toPlainText if isinstance(widget, QTextEdit) else widget.text
+        return widget, label_text
+
+    def _make_number_input(self, param, param_info):
+        py_type = param.get("python_type", {}).get("type", "float")
+        if py_type == "int":
+            widget = QSpinBox() # Use QSpinBox for integers
+            widget.setRange(int(param.get("minimum", -1000000)), int(param.get("maximum", 1000000)))
+        else: # float
+            widget = QDoubleSpinBox()
+            widget.setRange(param.get("minimum", -1000000.0), param.get("maximum", 1000000.0))
+            widget.setDecimals(param.get("precision", 2))
+        
+        default_value = param.get("value")
+        if default_value is not None: widget.setValue(float(default_value))
+        param_info['getter'] = widget.value
+        return widget, param_info['label']
+
+    def _make_slider_input(self, param, param_info):
+        widget = QSlider(Qt.Orientation.Horizontal)
+        widget.setRange(int(param.get("minimum", 0)), int(param.get("maximum", 100)))
+        widget.setValue(int(param.get("value", param.get("minimum", 0))))
+        # TODO: Add a QLabel to show current slider value if desired
+        param_info['getter'] = widget.value
+        return widget, param_info['label']
+
+    def _make_checkbox_input(self, param, param_info):
+        widget = QCheckBox(param_info['label']) # Label is part of checkbox
+        default_value = param.get("value")
+        if default_value is not None: widget.setChecked(bool(default_value))
+        param_info['getter'] = widget.isChecked
+        return widget, "" # No separate label needed for QFormLayout
+
+    def _make_choice_input(self, param, param_info):
+        widget = QComboBox()
+        choices = param.get("choices", [])
+        if choices: widget.addItems([str(c) for c in choices])
+        default_value = param.get("value")
+        if default_value is not None: widget.setCurrentText(str(default_value))
+        param_info['getter'] = widget.currentText # Or .currentData if set
+        return widget, param_info['label']
+
+    def _make_file_input(self, param, param_info):
+        file_input_widget = QWidget()
+        file_input_layout = QHBoxLayout(file_input_widget)
+        file_input_layout.setContentsMargins(0,0,0,0)
+        
+        file_label = QLabel("No file selected.")
+        file_button = QPushButton("Browse...")
+        file_button.clicked.connect(partial(self.handle_exec_browse_file, param_info['name']))
+        
+        file_input_layout.addWidget(file_label, 1) # Give label more space
+        file_input_layout.addWidget(file_button)
+        param_info['kind'] = param_info['type'] # e.g. "image"; picks the browse dialog's name filter
+        param_info['type'] = 'filepath' # Special handling for file types
+        param_info['file_label'] = file_label # Kept directly, so browsing needn't search the widget tree
+        param_info['getter'] = lambda: param_info.get('selected_file_path') # Set by _apply_selected_file
+        return file_input_widget, param_info['label']
+
+    def _make_unsupported_input(self, param, param_info):
+        widget = QLineEdit()
+        widget.setPlaceholderText(f"Unsupported type: {param_info['component']} / {param_info['type']}")
+        widget.setEnabled(False)
+        param_info['getter'] = widget.text
+        return widget, param_info['label']
+
+    # component/type name -> (priority, widget factory) for populate_execution_inputs
+    _PARAM_WIDGET_KINDS = {
+        **dict.fromkeys(["textbox", "text"], (0, _make_text_input)),
+        "number": (1, _make_number_input),
+        "slider": (2, _make_slider_input),
+        "checkbox": (3, _make_checkbox_input),
+        **dict.fromkeys(["dropdown", "radio"], (4, _make_choice_input)),
+        **dict.fromkeys(["image", "audio", "video", "file", "uploadbutton"], (5, _make_file_input)),
+    }
+
+    # Gradio component -> file dialog name filter; other file inputs accept any file
+    _FILE_NAME_FILTERS = {
+        "image": "Images (*.png *.jpg *.jpeg *.webp *.bmp *.gif)",
+        "audio": "Audio (*.wav *.mp3 *.flac *.ogg *.m4a)",
+        "video": "Video (*.mp4 *.webm *.mov *.avi *.mkv)",
+    }
+
+    def handle_exec_browse_file(self, param_name_key, checked=False): # checked: passed along by QPushButton.clicked
+        param_info = self.dynamic_input_widgets.get(param_name_key)
+        if not param_info:
+            print(f"Error: No file input registered for {param_name_key}")
             return
 
-        # TODO: Determine file type filter based on param.get("file_types") if available
-        file_dialog = QFileDialog(self)
-        # Example: if param.get("file_types") == ["image"], set name filter "Images (*.png *.jpg)"
-        file_path, _ = file_dialog.getOpenFileName(self, f"Select File for {param_name_key}")
-        
+        # Window-modal and opened with open(), so control returns to the event loop while the user picks a file
+        file_dialog = QFileDialog(self, f"Select File for {param_name_key}")
+        file_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        name_filter = self._FILE_NAME_FILTERS.get(param_info['component']) or self._FILE_NAME_FILTERS.get(param_info.get('kind', ''))
+        if name_filter:
+            file_dialog.setNameFilters([name_filter, "All files (*)"])
+        file_dialog.fileSelected.connect(lambda file_path: self._apply_selected_file(param_info, file_path))
+        file_dialog.rejected.connect(lambda: self._apply_selected_file(param_info, ""))
+        file_dialog.open()
+
+    def _apply_selected_file(self, param_info, file_path):
+        if self.dynamic_input_widgets.get(param_info['name']) is not param_info: # Form was rebuilt meanwhile
+            return
+        file_label_widget = param_info['file_label']
         if file_path:
-            file_label_widget.setText(os.path.basename(file_path))
-            # Store the full path in the dynamic_input_widgets, associated with the label or a hidden field
-            # For simplicity, we'll retrieve from label's tooltip or a dedicated attribute if needed.
-            # Here, we assume the label's text is enough for display, and we store the actual path.
-            self.dynamic_input_widgets[param_name_key]['selected_file_path'] = file_path 
+            # Elided once to the label's current width, so a long path doesn't widen the form; full path on hover
+            file_label_widget.setText(file_label_widget.fontMetrics().elidedText(
+                file_path, Qt.TextElideMode.ElideMiddle, max(file_label_widget.width(), 1)))
+            file_label_widget.setToolTip(file_path)
+            param_info['selected_file_path'] = file_path # What the getter returns
         else:
             file_label_widget.setText("No file selected.")
-            if 'selected_file_path' in self.dynamic_input_widgets[param_name_key]:
-                del self.dynamic_input_widgets[param_name_key]['selected_file_path']
-
+            file_label_widget.setToolTip("")
+            param_info.pop('selected_file_path', None)
 
     def handle_exec_clear_inputs(self):
         # This will clear and re-populate with defaults if API is loaded
         if self.current_loaded_api_details_exec:
             self.populate_execution_inputs(self.current_loaded_api_details_exec)
         else: # If no API loaded, just clear the form layout
-            self._clear_layout(self.exec_params_form_layout)
+            self._reset_exec_params_widget()
             self.dynamic_input_widgets.clear()
 
     def handle_exec_run_space(self):
         if not self.current_loaded_api_details_exec or not self.current_selected_endpoint_name_exec:
-            QMessageBox.warning(self, "Execution Error", "API details not loaded or endpoint not selected.")
+            self._message_box(QMessageBox.Icon.Warning, "Execution Error", "API details not loaded or endpoint not selected.")
             return
 
-        collected_params = [] # Gradio client expects a list of args
-        param_names_ordered = [] # To match the order of parameters in API details
-
-        # Ensure we iterate in the order defined by the API
-        endpoint_info = self.current_loaded_api_details_exec["named_endpoints"][self.current_selected_endpoint_name_exec]
-        api_parameters = endpoint_info.get("parameters", [])
-
         try:
-            for api_param_info in api_parameters:
-                param_name = api_param_info.get("name", api_param_info.get("label"))
-                stored_param_info = self.dynamic_input_widgets.get(param_name)
-
-                if not stored_param_info:
-                    # This might happen if a parameter was optional and not rendered, or an error.
-                    # Gradio often requires all args, so send None or default.
-                    # For simplicity, we'll try to send None.
-                    # Check api_param_info for 'default' or if it's optional.
-                    # This part needs more robust handling of optional/default params from Gradio API spec.
-                    print(f"Warning: No widget found for API parameter '{param_name}'. Sending None.")
-                    collected_params.append(None) 
-                    continue
-
-                widget = stored_param_info['widget']
-                param_type = stored_param_info['type']
-
-                value = None
-                if param_type == 'filepath':
-                    value = stored_param_info.get('selected_file_path')
-                    if value:
-                        value = handle_file(value) # Prepare for Gradio client
-                    # If no file selected, Gradio might expect None for optional files
-                elif isinstance(widget, QLineEdit):
-                    value = widget.text()
-                elif isinstance(widget, QTextEdit):
-                    value = widget.toPlainText()
-                elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-                    value = widget.value()
-                elif isinstance(widget, QCheckBox):
-                    value = widget.isChecked()
-                elif isinstance(widget, QComboBox):
-                    value = widget.currentText() # Or .currentData() if set
-                elif isinstance(widget, QSlider):
-                    value = widget.value()
-                # Add other widget types as needed
-                collected_params.append(value)
+            collected_params, parameters_dict = self._collect_exec_params()
+            # Captured now, so saving the result records what was run even if the form changes meanwhile
+            run_context = (self.current_loaded_space_id_exec, parameters_dict, self.exec_task_desc_input.toPlainText().strip())
 
             self.exec_run_button.setText("Executing...")
             self.exec_run_button.setEnabled(False)
-            QApplication.processEvents()
-
-            # This function needs to be implemented in space_runner.py
-            # It should return a tuple: (result_data, output_type_string, error_string_if_any)
-            # output_type_string: 'text', 'image_path', 'json_data', 'file_path', 'url', 'error'
-            result_data, output_type, error_msg = space_runner.execute_space_endpoint(
-                self.current_loaded_space_id_exec,
-                self.current_selected_endpoint_name_exec,
-                *collected_params # Unpack as positional arguments
-            )
+            self._start_worker(self._execute_space_endpoint,
+                               self.current_loaded_space_id_exec,
+                               self.current_selected_endpoint_name_exec,
+                               collected_params,
+                               on_finished=lambda execution_result: self._on_exec_run_finished(execution_result, run_context),
+                               on_error=self._on_exec_run_error)
+
+        except Exception as e:
+            self._on_exec_run_error(str(e))
+
+    @staticmethod
+    def _execute_space_endpoint(space_id, endpoint_name, collected_params):
+        # This function needs to be implemented in space_runner.py
+        # It should return a tuple: (result_data, output_type_string, error_string_if_any)
+        # output_type_string: 'text', 'image_path', 'json_data', 'file_path', 'url', 'error'
+        import space_runner # Deferred until the Execution tab is first used
+        return space_runner.execute_space_endpoint(
+            space_id,
+            endpoint_name,
+            *collected_params # Unpack as positional arguments
+        )
+
+    def _on_exec_run_finished(self, execution_result, run_context=None):
+        try:
+            result_data, output_type, error_msg = execution_result
             
             self.current_exec_output_data = result_data
             self.current_exec_output_type = output_type
+            self.current_exec_run_context = run_context
 
             if error_msg:
                  self.display_execution_output(f"Error: {error_msg}", "error")
@@ -687,73 +1109,91 @@ class SpacesUI(QMainWindow):
                 self.display_execution_output(result_data, output_type)
                 if self.exec_save_result_checkbox.isChecked() and output_type != 'error':
                     self.handle_exec_save_current_result_to_library()
-
         except Exception as e:
-            QMessageBox.critical(self, "Execution Failed", f"An error occurred during execution: {e}")
-            self.display_execution_output(f"Client-side error: {e}", "error")
-            self.current_exec_output_data = None
-            self.current_exec_output_type = None
+            self._on_exec_run_error(str(e))
         finally:
             self.exec_run_button.setText("Execute Space")
             self.exec_run_button.setEnabled(True)
 
+    def _on_exec_run_error(self, error_message):
+        self._message_box(QMessageBox.Icon.Critical, "Execution Failed", f"An error occurred during execution: {error_message}")
+        self.display_execution_output(f"Client-side error: {error_message}", "error")
+        self.current_exec_output_data = None
+        self.current_exec_output_type = None
+        self.current_exec_run_context = None
+        self.exec_run_button.setText("Execute Space")
+        self.exec_run_button.setEnabled(True)
+
     def display_execution_output(self, data, output_type_str):
-        self.exec_output_file_button.disconnect() # Disconnect previous signals for file button
-
-        if output_type_str == 'text' or output_type_str == 'json_data' or output_type_str == 'error':
-            if output_type_str == 'json_data' and isinstance(data, (dict, list)):
-                try:
-                    self.exec_output_text_view.setText(json.dumps(data, indent=2))
-                except Exception: # If data is not directly serializable, show as string
-                    self.exec_output_text_view.setText(str(data))
-            else:
-                self.exec_output_text_view.setText(str(data))
-            self.exec_output_stack.setCurrentWidget(self.exec_output_text_view)
-        
-        elif output_type_str == 'image_path':
-            if data and os.path.exists(str(data)):
-                pixmap = QPixmap(str(data))
-                if pixmap.isNull():
-                    self.exec_output_image_label.setText(f"Error loading image (or not an image):\n{data}")
-                else:
-                    max_h = self.exec_output_image_scroll.height() - 20 # Max height for image preview
-                    if pixmap.height() > max_h and max_h > 0 :
-                         pixmap = pixmap.scaledToHeight(max_h, Qt.TransformationMode.SmoothTransformation)
-                    self.exec_output_image_label.setPixmap(pixmap)
-                self.exec_output_stack.setCurrentWidget(self.exec_output_image_scroll)
-            else:
-                self.exec_output_image_label.setText(f"Image file not found or path is invalid:\n{data}")
-                self.exec_output_stack.setCurrentWidget(self.exec_output_image_scroll)
-        
-        elif output_type_str in ['audio_path', 'video_path', 'file_path', 'url']:
-            self.exec_output_file_button.setText(f"Open {output_type_str.replace('_path','').capitalize()}: {os.path.basename(str(data)) if data else 'N/A'}")
-            if data:
-                 self.exec_output_file_button.clicked.connect(lambda: self.handle_rl_open_output_file(str(data), is_url=(output_type_str=='url')))
-            self.exec_output_stack.setCurrentWidget(self.exec_output_file_button_widget)
-        
-        else: # Fallback or unknown type
-            self.exec_output_text_view.setText(f"Output type '{output_type_str}' received.\nData: {str(data)}")
-            self.exec_output_stack.setCurrentWidget(self.exec_output_text_view) # Show as text
+        self._exec_output_target = None
+        handler = self._EXEC_OUTPUT_HANDLERS.get(output_type_str, SpacesUI._exec_show_unknown)
+        handler(self, data, output_type_str)
+
+    def _exec_show_text(self, data, output_type_str):
+        if output_type_str == 'json_data' and isinstance(data, (dict, list)):
+            # Serialized on a worker; a large response would otherwise stall the GUI thread
+            self._set_output_text(self.exec_output_text_view, self.exec_output_load_full_button, "Formatting...")
+            def on_formatted(text):
+                if self.current_exec_output_data is data: # Not replaced by a newer run meanwhile
+                    self._set_output_text(self.exec_output_text_view, self.exec_output_load_full_button, text)
+            self._start_worker(_format_json_output, data, on_finished=on_formatted,
+                               on_error=lambda error_message: on_formatted(str(data))) # If data is not directly serializable, show as string
+        else:
+            self._set_output_text(self.exec_output_text_view, self.exec_output_load_full_button, str(data))
+        self.exec_output_stack.setCurrentWidget(self.exec_output_text_page)
+
+    def _exec_show_image(self, data, output_type_str):
+        stat_result = self._stat(str(data)) if data else None
+        if stat_result is not None:
+            max_h = self.exec_output_image_scroll.height() - 20 # Max height for image preview
+            self._show_image_async(self.exec_output_image_label, str(data), max_h, stat_result)
+        else:
+            self._pending_image_for_label.pop(self.exec_output_image_label, None)
+            self.exec_output_image_label.setText(f"Image file not found or path is invalid:\n{data}")
+        self.exec_output_stack.setCurrentWidget(self.exec_output_image_scroll)
+
+    def _exec_show_openable(self, data, output_type_str):
+        self.exec_output_file_button.setText(f"Open {output_type_str.replace('_path','').capitalize()}: {os.path.basename(str(data)) if data else 'N/A'}")
+        if data:
+             is_url = output_type_str == 'url'
+             self._exec_output_target = (str(data), is_url, self._output_qurl(str(data), is_url))
+        self.exec_output_stack.setCurrentWidget(self.exec_output_file_button_widget)
+
+    def _exec_show_unknown(self, data, output_type_str):
+        self._set_output_text(self.exec_output_text_view, self.exec_output_load_full_button, f"Output type '{output_type_str}' received.\nData: {str(data)}")
+        self.exec_output_stack.setCurrentWidget(self.exec_output_text_page) # Show as text
+
+    # output_type -> handler for the Execution tab's output pane; anything else is shown as text with its type
+    _EXEC_OUTPUT_HANDLERS = {
+        'text': _exec_show_text,
+        'json_data': _exec_show_text,
+        'error': _exec_show_text,
+        'image_path': _exec_show_image,
+        'audio_path': _exec_show_openable,
+        'video_path': _exec_show_openable,
+        'file_path': _exec_show_openable,
+        'url': _exec_show_openable,
+    }
+
+    def _open_exec_output(self):
+        if self._exec_output_target:
+            self.handle_rl_open_output_file(*self._exec_output_target)
 
     def handle_exec_clear_output(self):
         self.exec_output_stack.setCurrentIndex(0) # Placeholder
-        self.exec_output_text_view.clear()
+        self._set_output_text(self.exec_output_text_view, self.exec_output_load_full_button, "")
         self.exec_output_image_label.clear()
         self.exec_output_file_button.setText("Open File/Media")
-        self.exec_output_file_button.disconnect()
+        self._exec_output_target = None
         self.current_exec_output_data = None
         self.current_exec_output_type = None
 
-    def handle_exec_save_current_result_to_library(self):
-        if self.current_exec_output_data is None or self.current_exec_output_type is None:
-            QMessageBox.information(self, "Save Error", "No valid execution result to save.")
-            return
-
-        space_id = self.current_loaded_space_id_exec
-        task_desc = self.exec_task_desc_input.toPlainText().strip()
-        if not task_desc:
-            task_desc = f"Execution of {space_id}" # Default task description
-
+    def _collect_exec_params(self) -> tuple[list, dict]:
+        """
+        Reads each execution form input once, in the order defined by the API.
+        Returns (arguments for the Gradio call, values by parameter name as stored with a saved result).
+        """
+        collected_params = [] # Gradio client expects a list of args
         parameters_dict = {}
         endpoint_info = self.current_loaded_api_details_exec["named_endpoints"][self.current_selected_endpoint_name_exec]
         api_parameters = endpoint_info.get("parameters", [])
@@ -761,31 +1201,45 @@ class SpacesUI(QMainWindow):
         for api_param_info in api_parameters:
             param_name = api_param_info.get("name", api_param_info.get("label"))
             stored_param_info = self.dynamic_input_widgets.get(param_name)
-            if stored_param_info:
-                widget = stored_param_info['widget']
-                param_type = stored_param_info['type']
-                value = None
-                if param_type == 'filepath':
-                    value = stored_param_info.get('selected_file_path', "Not provided")
-                elif isinstance(widget, QLineEdit): value = widget.text()
-                elif isinstance(widget, QTextEdit): value = widget.toPlainText()
-                elif isinstance(widget, (QSpinBox, QDoubleSpinBox)): value = widget.value()
-                elif isinstance(widget, QCheckBox): value = widget.isChecked()
-                elif isinstance(widget, QComboBox): value = widget.currentText()
-                elif isinstance(widget, QSlider): value = widget.value()
+
+            if not stored_param_info:
+                # This might happen if a parameter was optional and not rendered, or an error.
+                # Gradio often requires all args, so send None or default.
+                # For simplicity, we'll try to send None.
+                # Check api_param_info for 'default' or if it's optional.
+                # This part needs more robust handling of optional/default params from Gradio API spec.
+                print(f"Warning: No widget found for API parameter '{param_name}'. Sending None.")
+                collected_params.append(None)
+                continue
+
+            value = stored_param_info['getter']() # Registered when the input widget was built
+            if stored_param_info['type'] == 'filepath':
+                parameters_dict[param_name] = value if value is not None else "Not provided"
+                if value:
+                    from gradio_client import handle_file # Deferred; only needed for file inputs
+                    value = handle_file(value) # Prepare for Gradio client
+                # If no file selected, Gradio might expect None for optional files
+            else:
                 parameters_dict[param_name] = value
-        
-        try:
-            parameters_json = json.dumps(parameters_dict, indent=2)
-        except TypeError: # Handle non-serializable if any (should be rare with basic types)
-            parameters_json = json.dumps({k: str(v) for k, v in parameters_dict.items()}, indent=2)
+            collected_params.append(value)
+        return collected_params, parameters_dict
+
+    def handle_exec_save_current_result_to_library(self):
+        if self.current_exec_output_data is None or self.current_exec_output_type is None:
+            self._message_box(QMessageBox.Icon.Information, "Save Error", "No valid execution result to save.")
+            return
 
+        # The Space, inputs and task description the result was produced with; the form may have been edited while it ran
+        space_id, parameters_dict, task_desc = self.current_exec_run_context or (
+            self.current_loaded_space_id_exec, self._collect_exec_params()[1], self.exec_task_desc_input.toPlainText().strip())
+        if not task_desc:
+            task_desc = f"Execution of {space_id}" # Default task description
 
         # Ensure output_data is serializable or a path string
         output_data_to_save = self.current_exec_output_data
         if self.current_exec_output_type == 'json_data' and not isinstance(output_data_to_save, str):
             try:
-                output_data_to_save = json.dumps(output_data_to_save)
+                output_data_to_save = _json_dumps(output_data_to_save)
             except TypeError:
                 output_data_to_save = str(output_data_to_save)
         elif not isinstance(output_data_to_save, (str, int, float, bool)) and output_data_to_save is not None:
@@ -794,23 +1248,33 @@ class SpacesUI(QMainWindow):
                 output_data_to_save = str(output_data_to_save)
 
 
-        try:
-            # results_manager.save_content should handle copying files if output_type is a path
-            # and the path is temporary. For now, we assume it saves the path as is.
-            results_manager.save_content(
-                space_id=space_id,
-                task_description=task_desc,
-                parameters_json=parameters_json,
-                output_data=output_data_to_save,
-                output_type=self.current_exec_output_type,
-                notes="" # Initially no notes from execution tab
-            )
-            QMessageBox.information(self, "Result Saved", f"Execution result for '{space_id}' saved to library.")
-            self.load_results_from_db() # Refresh library view if it's visible
-        except Exception as e:
-            QMessageBox.critical(self, "Save to Library Failed", f"Could not save result: {e}")
-            print(f"Error saving to library: {e}")
+        # The insert (and its commit) runs on the single-thread write pool, which uses its own connection;
+        # file paths are saved as is
+        self._start_worker(
+            results_manager.add_content,
+            space_id=space_id,
+            task_description=task_desc,
+            output_type=self.current_exec_output_type,
+            output_data=output_data_to_save,
+            parameters=parameters_dict,
+            notes="", # Initially no notes from execution tab
+            on_finished=lambda content_id: self._on_exec_result_saved(content_id, space_id),
+            on_error=self._on_exec_result_save_error,
+            pool=self._db_write_pool
+        )
+
+    def _on_exec_result_saved(self, content_id, space_id):
+        if content_id is None: # add_content reports database errors by returning None
+            self._on_exec_result_save_error("The database rejected the record (see console output).")
+            return
+        self._message_box(QMessageBox.Icon.Information, "Result Saved", f"Execution result for '{space_id}' saved to library.")
+        # New records sort first, so only the first page can show it; other pages and an uninitialized tab are left alone
+        if self.results_library_gb not in self._pending_tab_inits and self.current_results_page == 0:
+            self.load_results_from_db()
 
+    def _on_exec_result_save_error(self, error_message):
+        self._message_box(QMessageBox.Icon.Critical, "Save to Library Failed", f"Could not save result: {error_message}")
+        print(f"Error saving to library: {error_message}")
 
     # --- Methods for Results Library Tab ---
     def init_results_library_tab(self):
@@ -838,16 +1302,21 @@ class SpacesUI(QMainWindow):
 
         results_table_gb = QGroupBox("Stored Results")
         results_table_layout = QVBoxLayout(results_table_gb)
-        self.results_table_viewer = QTableWidget()
-        self.results_table_viewer.setColumnCount(5)
-        self.results_table_viewer.setHorizontalHeaderLabels(["ID", "Space ID", "Task (Summary)", "Output Type", "Timestamp"])
-        self.results_table_viewer.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.results_table_viewer.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.results_table_viewer.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.results_table_viewer.itemSelectionChanged.connect(self.handle_results_table_selection)
-        self.results_table_viewer.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.results_table_viewer.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents) # ID
-        self.results_table_viewer.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents) # Output Type
+        self.results_library_model = ResultsLibraryModel(self)
+        self.results_table_viewer = QTableView()
+        self.results_table_viewer.setModel(self.results_library_model)
+        self.results_table_viewer.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.results_table_viewer.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.results_table_viewer.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.results_table_viewer.selectionModel().selectionChanged.connect(self.handle_results_table_selection)
+        # Fixed widths instead of ResizeToContents, which re-measures every cell on each page load
+        library_header = self.results_table_viewer.horizontalHeader()
+        library_header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        library_header.resizeSection(0, 60) # ID
+        library_header.resizeSection(1, 200) # Space ID
+        library_header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch) # Task (Summary)
+        library_header.resizeSection(3, 110) # Output Type
+        library_header.resizeSection(4, 170) # Timestamp
         results_table_layout.addWidget(self.results_table_viewer)
         
         pagination_layout = QHBoxLayout()
@@ -861,6 +1330,21 @@ class SpacesUI(QMainWindow):
         self.rl_limit_spinbox.setValue(self.results_per_page)
         self.rl_limit_spinbox.setToolTip("Results per page")
         self.rl_limit_spinbox.valueChanged.connect(self.handle_rl_limit_changed)
+        # Spinbox arrows and typing (here and in the filter fields) fire a signal per step or keystroke;
+        # reload the first page once they settle
+        self._reload_debounce = QTimer(self)
+        self._reload_debounce.setSingleShot(True)
+        self._reload_debounce.setInterval(250)
+        self._reload_debounce.timeout.connect(lambda: self.load_results_from_db(page_to_load=0))
+        # Lambdas drop the signal argument; currentIndexChanged's int would otherwise select QTimer.start(msec)
+        self.rl_space_id_filter.textChanged.connect(lambda _text: self._reload_debounce.start())
+        self.rl_task_keyword_filter.textChanged.connect(lambda _text: self._reload_debounce.start())
+        self.rl_output_type_filter.currentIndexChanged.connect(lambda _index: self._reload_debounce.start())
+        self._pending_output_record = None
+        self._selection_debounce = QTimer(self) # Coalesces output loading while the selection is changing
+        self._selection_debounce.setSingleShot(True)
+        self._selection_debounce.setInterval(120)
+        self._selection_debounce.timeout.connect(self._load_selected_output)
         pagination_layout.addWidget(self.rl_prev_page_button)
         pagination_layout.addStretch()
         pagination_layout.addWidget(self.rl_page_label)
@@ -903,9 +1387,8 @@ class SpacesUI(QMainWindow):
         placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.rl_output_data_display_stack.addWidget(placeholder_label)
         # Page 1: Text
-        self.rl_output_text_view = QTextEdit()
-        self.rl_output_text_view.setReadOnly(True)
-        self.rl_output_data_display_stack.addWidget(self.rl_output_text_view)
+        self.rl_output_text_page, self.rl_output_text_view, self.rl_output_load_full_button = self._build_output_text_page()
+        self.rl_output_data_display_stack.addWidget(self.rl_output_text_page)
         # Page 2: Image
         self.rl_output_image_view_scroll = QScrollArea()
         self.rl_output_image_view_scroll.setWidgetResizable(True)
@@ -917,6 +1400,8 @@ class SpacesUI(QMainWindow):
         self.rl_open_file_button_widget = QWidget()
         button_layout = QVBoxLayout(self.rl_open_file_button_widget)
         self.rl_open_file_button = QPushButton("Open File/Media")
+        self._rl_output_target = None # (path_or_url, is_url, QUrl or None) opened by rl_open_file_button
+        self.rl_open_file_button.clicked.connect(self._open_rl_output)
         button_layout.addWidget(self.rl_open_file_button)
         button_layout.addStretch()
         self.rl_output_data_display_stack.addWidget(self.rl_open_file_button_widget)
@@ -950,9 +1435,15 @@ class SpacesUI(QMainWindow):
     def load_results_from_db(self, page_to_load=None):
         if page_to_load is not None:
             self.current_results_page = page_to_load
+        if self.current_results_page == 0:
+            self._rl_page_keys = [None] # Filters or page size may have changed; earlier cursors no longer apply
         
-        offset = self.current_results_page * self.results_per_page
         limit = self.results_per_page
+        if self.current_results_page < len(self._rl_page_keys):
+            # Keyset pagination: start right after the last row of the previous page
+            after, offset = self._rl_page_keys[self.current_results_page], 0
+        else:
+            after, offset = None, self.current_results_page * self.results_per_page
 
         space_id = self.rl_space_id_filter.text().strip() or None
         task_keyword = self.rl_task_keyword_filter.text().strip() or None
@@ -960,51 +1451,57 @@ class SpacesUI(QMainWindow):
         if output_type == "Any":
             output_type = None
 
+        self._results_load_seq += 1
+        seq = self._results_load_seq
+        self._start_worker(
+            lambda **filters: list(results_manager.iter_content_metadata(**filters)),
+            output_type=output_type,
+            space_id=space_id,
+            task_keyword=task_keyword,
+            limit=limit,
+            offset=offset,
+            after=after,
+            on_finished=lambda records: self._populate_results_library(records, seq, limit),
+            on_error=lambda error_message: self._on_results_load_error(error_message, seq)
+        )
+
+    def _on_results_load_error(self, error_message, seq):
+        if seq != self._results_load_seq: # A newer load superseded this one
+            return
+        self._message_box(QMessageBox.Icon.Critical, "Database Error", f"Error loading results: {error_message}")
+        print(f"Error loading results: {error_message}")
+
+    def _populate_results_library(self, records, seq, limit):
+        if seq != self._results_load_seq: # A newer load superseded this one
+            return
         try:
-            records = results_manager.filter_content(
-                output_type=output_type,
-                space_id=space_id,
-                task_keyword=task_keyword,
-                limit=limit,
-                offset=offset
-            )
-            self.results_table_viewer.setRowCount(0)
+            self.results_library_model.set_rows(records)
+            if records:
+                del self._rl_page_keys[self.current_results_page + 1:]
+                self._rl_page_keys.append((records[-1]['timestamp'], records[-1]['id']))
+            self.handle_results_table_selection() # Model reset clears the selection without emitting selectionChanged
 
             if not records:
                 if self.current_results_page > 0: 
                     self.current_results_page -=1 
                     # self.load_results_from_db() # Avoid potential infinite loop if last page is empty
                     self.rl_page_label.setText(f"Page: {self.current_results_page + 1}") # Update label
-                    QMessageBox.information(self, "No More Results", "You have reached the last page of results for the current filter.")
+                    self._message_box(QMessageBox.Icon.Information, "No More Results", "You have reached the last page of results for the current filter.")
                     self.rl_next_page_button.setEnabled(False)
                     return
                 else:
-                    QMessageBox.information(self, "No Results", "No results found for the current filters.")
-            
-            for row, record in enumerate(records):
-                self.results_table_viewer.insertRow(row)
-                self.results_table_viewer.setItem(row, 0, QTableWidgetItem(str(record.get('id', 'N/A'))))
-                self.results_table_viewer.setItem(row, 1, QTableWidgetItem(str(record.get('space_id', 'N/A'))))
-                
-                task_desc_full = str(record.get('task_description', 'N/A'))
-                task_desc_summary = (task_desc_full[:75] + '...') if len(task_desc_full) > 75 else task_desc_full
-                self.results_table_viewer.setItem(row, 2, QTableWidgetItem(task_desc_summary))
-                
-                self.results_table_viewer.setItem(row, 3, QTableWidgetItem(str(record.get('output_type', 'N/A'))))
-                self.results_table_viewer.setItem(row, 4, QTableWidgetItem(str(record.get('timestamp', 'N/A'))))
-            
-            self.results_table_viewer.resizeColumnsToContents()
-            self.results_table_viewer.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+                    self._message_box(QMessageBox.Icon.Information, "No Results", "No results found for the current filters.")
 
             self.rl_page_label.setText(f"Page: {self.current_results_page + 1}")
             self.rl_prev_page_button.setEnabled(self.current_results_page > 0)
             self.rl_next_page_button.setEnabled(len(records) == limit)
 
         except Exception as e:
-            QMessageBox.critical(self, "Database Error", f"Error loading results: {e}")
+            self._message_box(QMessageBox.Icon.Critical, "Database Error", f"Error loading results: {e}")
             print(f"Error loading results: {e}")
 
     def handle_rl_filter_results(self):
+        self._reload_debounce.stop() # Loading now; a pending live-filter reload would repeat it
         self.load_results_from_db(page_to_load=0)
 
     def handle_rl_next_page(self):
@@ -1016,158 +1513,241 @@ class SpacesUI(QMainWindow):
             
     def handle_rl_limit_changed(self, value):
         self.results_per_page = value
-        self.load_results_from_db(page_to_load=0)
+        self._reload_debounce.start() # Restarts the countdown if already pending
 
     def handle_results_table_selection(self):
         selected_rows = self.results_table_viewer.selectionModel().selectedRows()
         if not selected_rows:
             self.rl_detail_area_group.setVisible(False)
             self.selected_content_id_in_library = None
+            self._current_library_record = None
             return
 
         selected_row_index = selected_rows[0].row()
+        record = self.results_library_model.row_at(selected_row_index)
         try:
-            self.selected_content_id_in_library = int(self.results_table_viewer.item(selected_row_index, 0).text())
+            content_id = int(record.get('id'))
         except (ValueError, TypeError):
-            QMessageBox.warning(self, "Selection Error", "Invalid ID for selected row.")
+            self._message_box(QMessageBox.Icon.Warning, "Selection Error", "Invalid ID for selected row.")
             self.selected_content_id_in_library = None
             return
 
-        record = results_manager.get_content_by_id(self.selected_content_id_in_library)
+        if content_id == self.selected_content_id_in_library: # Same record; details are already shown
+            return
+        self.selected_content_id_in_library = content_id
+        self._current_library_record = record
+        self._show_result_details(record)
+
+        # The output is fetched and rendered only once the selection settles, so arrowing through
+        # the table doesn't load and format every intermediate record
+        self.rl_output_data_display_stack.setCurrentIndex(0)
+        self._pending_output_record = record
+        self._selection_debounce.start()
+
+    def _load_selected_output(self):
+        record = self._pending_output_record
+        self._pending_output_record = None
+        if record is None:
+            return
+        content_id = record.get('id')
+        if content_id != self.selected_content_id_in_library:
+            return
+        # The page query leaves out output_data, which can be large; fetch it for this record only
+        self._start_worker(
+            results_manager.get_content_output, content_id,
+            on_finished=lambda output: self._show_result_output(record, output, content_id),
+            on_error=lambda error_message: self._show_result_output(record, None, content_id)
+        )
+
+    def _show_result_details(self, record):
+        self.rl_id_label.setText(str(record.get('id', 'N/A')))
+        self.rl_space_id_label.setText(record.get('space_id', 'N/A'))
+        self.rl_task_desc_text_viewer.setPlainText(record.get('task_description') or 'N/A')
+        self.rl_timestamp_label.setText(record.get('timestamp', 'N/A'))
+        self.rl_output_type_label.setText(record.get('output_type', 'N/A'))
+        
+        params_data = record.get('parameters')
+        if isinstance(params_data, str): # If stored as JSON string
+            try:
+                params_dict = _json_loads(params_data)
+                self.rl_parameters_text_viewer.setPlainText(_json_pretty(params_dict))
+            except (ValueError, TypeError): # JSONDecodeError is a ValueError for both json and orjson
+                self.rl_parameters_text_viewer.setPlainText(params_data) # Show as is
+        elif isinstance(params_data, dict): # If already a dict (e.g. from older saves)
+             self.rl_parameters_text_viewer.setPlainText(_json_pretty(params_data))
+        else:
+             self.rl_parameters_text_viewer.setPlainText(str(params_data))
 
-        if record:
-            self.rl_id_label.setText(str(record.get('id', 'N/A')))
-            self.rl_space_id_label.setText(record.get('space_id', 'N/A'))
-            self.rl_task_desc_text_viewer.setText(record.get('task_description', 'N/A'))
-            self.rl_timestamp_label.setText(record.get('timestamp', 'N/A'))
-            self.rl_output_type_label.setText(record.get('output_type', 'N/A'))
-            
-            params_data = record.get('parameters')
-            if isinstance(params_data, str): # If stored as JSON string
-                try:
-                    params_dict = json.loads(params_data)
-                    self.rl_parameters_text_viewer.setText(json.dumps(params_dict, indent=2))
-                except json.JSONDecodeError:
-                    self.rl_parameters_text_viewer.setText(params_data) # Show as is
-            elif isinstance(params_data, dict): # If already a dict (e.g. from older saves)
-                 self.rl_parameters_text_viewer.setText(json.dumps(params_data, indent=2))
-            else:
-                 self.rl_parameters_text_viewer.setText(str(params_data))
+        self.rl_notes_edit_area.setPlainText(record.get('notes') or '')
+        self.rl_detail_area_group.setVisible(True)
 
-            self.rl_notes_edit_area.setText(record.get('notes', ''))
-            self.update_output_data_display(record)
-            self.rl_detail_area_group.setVisible(True)
-        else:
-            QMessageBox.warning(self, "Error", f"Could not retrieve details for ID {self.selected_content_id_in_library}.")
-            self.rl_detail_area_group.setVisible(False)
-            self.selected_content_id_in_library = None
+    def _show_result_output(self, record, output, content_id):
+        if content_id != self.selected_content_id_in_library: # Selection changed while loading
+            return
+        if output is None:
+            self._message_box(QMessageBox.Icon.Warning, "Error", f"Could not retrieve output data for ID {content_id}.")
+            return
+        output_data, output_data_display = output
+        self.update_output_data_display({**record, 'output_data': output_data, 'output_data_display': output_data_display})
 
     def update_output_data_display(self, record):
-        output_type = record.get('output_type', 'other').lower()
+        output_type = record.get('output_type') or 'other' # Stored lowercase by results_manager
         output_data = record.get('output_data', '')
 
-        self.rl_open_file_button.disconnect() 
-        
-        if output_type == 'text' or output_type == 'error':
-            self.rl_output_text_view.setText(str(output_data))
-            self.rl_output_data_display_stack.setCurrentWidget(self.rl_output_text_view)
-        elif output_type == 'json_data':
-            try:
-                # Assuming output_data is a string that needs parsing for pretty print
-                # Or it could already be a dict/list if not stored as string
-                if isinstance(output_data, str):
-                    parsed_json = json.loads(output_data)
-                    self.rl_output_text_view.setText(json.dumps(parsed_json, indent=2))
-                elif isinstance(output_data, (dict, list)): # If it was already structured
-                     self.rl_output_text_view.setText(json.dumps(output_data, indent=2))
-                else:
-                    self.rl_output_text_view.setText(str(output_data)) # Fallback
-            except (json.JSONDecodeError, TypeError):
-                self.rl_output_text_view.setText(str(output_data)) # Show as is if not valid JSON string or error
-            self.rl_output_data_display_stack.setCurrentWidget(self.rl_output_text_view)
-
-        elif output_type == 'image_path':
-            if output_data and os.path.exists(str(output_data)):
-                pixmap = QPixmap(str(output_data))
-                if pixmap.isNull():
-                    self.rl_output_image_label.setText(f"Error loading image (or not an image):\n{output_data}")
-                else:
-                    max_h = self.rl_output_image_view_scroll.height() - 20
-                    if pixmap.height() > max_h and max_h > 0:
-                        pixmap = pixmap.scaledToHeight(max_h, Qt.TransformationMode.SmoothTransformation)
-                    self.rl_output_image_label.setPixmap(pixmap)
-                self.rl_output_data_display_stack.setCurrentWidget(self.rl_output_image_view_scroll)
-            else:
-                self.rl_output_image_label.setText(f"Image file not found:\n{output_data}")
-                self.rl_output_data_display_stack.setCurrentWidget(self.rl_output_image_view_scroll)
-        
-        elif output_type in ['audio_path', 'video_path', 'file_path', 'url']:
-            base_name = os.path.basename(str(output_data)) if output_data else "N/A"
-            self.rl_open_file_button.setText(f"Open {output_type.replace('_path','').capitalize()}: {base_name}")
-            if output_data:
-                self.rl_open_file_button.clicked.connect(lambda checked=False, path=str(output_data), url=(output_type=='url'): self.handle_rl_open_output_file(path, is_url=url))
-            self.rl_output_data_display_stack.setCurrentWidget(self.rl_open_file_button_widget)
-        else: # Fallback to placeholder
-            self.rl_output_data_display_stack.setCurrentIndex(0) 
-
-    def handle_rl_open_output_file(self, file_path_or_url: str, is_url=False):
-        if not file_path_or_url:
-            QMessageBox.warning(self, "No Path", "No file path or URL provided.")
+        self._rl_output_target = None
+        handler = self._RL_OUTPUT_HANDLERS.get(output_type, SpacesUI._rl_show_placeholder)
+        handler(self, output_type, output_data, record)
+
+    def _rl_show_text(self, output_type, output_data, record):
+        self._set_output_text(self.rl_output_text_view, self.rl_output_load_full_button, str(output_data))
+        self.rl_output_data_display_stack.setCurrentWidget(self.rl_output_text_page)
+
+    def _rl_show_json(self, output_type, output_data, record):
+        if record.get('output_data_display') is not None: # Formatted once when the result was saved
+            self._set_output_text(self.rl_output_text_view, self.rl_output_load_full_button, record['output_data_display'])
+        else: # Saved before the display form existed, or not valid JSON
+            self._show_json_output(record.get('id'), output_data)
+        self.rl_output_data_display_stack.setCurrentWidget(self.rl_output_text_page)
+
+    def _rl_show_image(self, output_type, output_data, record):
+        stat_result = self._stat(str(output_data)) if output_data else None
+        if stat_result is not None:
+            max_h = self.rl_output_image_view_scroll.height() - 20
+            self._show_image_async(self.rl_output_image_label, str(output_data), max_h, stat_result)
+        else:
+            self._pending_image_for_label.pop(self.rl_output_image_label, None)
+            self.rl_output_image_label.setText(f"Image file not found:\n{output_data}")
+        self.rl_output_data_display_stack.setCurrentWidget(self.rl_output_image_view_scroll)
+
+    def _rl_show_openable(self, output_type, output_data, record):
+        base_name = os.path.basename(str(output_data)) if output_data else "N/A"
+        self.rl_open_file_button.setText(f"Open {output_type.replace('_path','').capitalize()}: {base_name}")
+        if output_data:
+            is_url = output_type == 'url'
+            self._rl_output_target = (str(output_data), is_url, self._output_qurl(str(output_data), is_url))
+        self.rl_output_data_display_stack.setCurrentWidget(self.rl_open_file_button_widget)
+
+    def _rl_show_placeholder(self, output_type, output_data, record):
+        self.rl_output_data_display_stack.setCurrentIndex(0)
+
+    # output_type -> handler for the Results Library output pane; anything else shows the placeholder
+    _RL_OUTPUT_HANDLERS = {
+        'text': _rl_show_text,
+        'error': _rl_show_text,
+        'json_data': _rl_show_json,
+        'image_path': _rl_show_image,
+        'audio_path': _rl_show_openable,
+        'video_path': _rl_show_openable,
+        'file_path': _rl_show_openable,
+        'url': _rl_show_openable,
+    }
+
+    def _open_rl_output(self):
+        if self._rl_output_target:
+            self.handle_rl_open_output_file(*self._rl_output_target)
+
+    JSON_PRETTY_CACHE_SIZE = 64
+    JSON_PRETTY_CACHE_MAX_CHARS = 8_000_000 # Also bounded by total text, so a few huge outputs can't pin lots of memory
+
+    def _cache_json_pretty(self, content_id, pretty):
+        self._drop_json_pretty(content_id)
+        self._json_pretty_cache[content_id] = pretty
+        self._json_pretty_cache_chars += len(pretty)
+        while (len(self._json_pretty_cache) > self.JSON_PRETTY_CACHE_SIZE
+               or self._json_pretty_cache_chars > self.JSON_PRETTY_CACHE_MAX_CHARS):
+            _, evicted = self._json_pretty_cache.popitem(last=False)
+            self._json_pretty_cache_chars -= len(evicted)
+
+    def _drop_json_pretty(self, content_id):
+        evicted = self._json_pretty_cache.pop(content_id, None)
+        if evicted is not None:
+            self._json_pretty_cache_chars -= len(evicted)
+
+    def _show_json_output(self, content_id, output_data):
+        """Shows a json_data output; formatting runs on a worker unless the text is already cached."""
+        cached = self._json_pretty_cache.get(content_id)
+        if cached is not None:
+            self._json_pretty_cache.move_to_end(content_id)
+            self._set_output_text(self.rl_output_text_view, self.rl_output_load_full_button, cached)
             return
-        
+
+        self._set_output_text(self.rl_output_text_view, self.rl_output_load_full_button, "Loading...")
+
+        def on_finished(pretty):
+            # Text returned as stored (too large to re-indent, or not JSON) is cheap to show again; don't cache it
+            if content_id is not None and pretty is not output_data:
+                self._cache_json_pretty(content_id, pretty)
+            if content_id == self.selected_content_id_in_library: # Ignore results for a record no longer shown
+                self._set_output_text(self.rl_output_text_view, self.rl_output_load_full_button, pretty)
+
+        self._start_worker(_format_json_output, output_data, on_finished=on_finished,
+                           on_error=lambda error_message: on_finished(str(output_data)))
+
+    @staticmethod
+    def _output_qurl(file_path_or_url: str, is_url: bool) -> QUrl | None:
+        """Parses an output's file path or URL for opening; None if it isn't a valid URL. Built once per shown output."""
         if is_url:
             qurl = QUrl(file_path_or_url)
             if not qurl.isValid() or qurl.scheme() not in ['http', 'https']:
                  # Try adding scheme if missing
                  qurl = QUrl("http://" + file_path_or_url)
                  if not qurl.isValid():
-                     QMessageBox.warning(self, "Invalid URL", f"The URL '{file_path_or_url}' is not valid.")
-                     return
-        else:
-            if not os.path.exists(file_path_or_url):
-                QMessageBox.warning(self, "File Not Found", f"The file\n{file_path_or_url}\nwas not found.")
+                     return None
+            return qurl
+        # Resolves relative paths against the working directory; openUrl itself fails for a missing file
+        return QUrl.fromUserInput(file_path_or_url, os.getcwd(), QUrl.UserInputResolutionOption.AssumeLocalFile)
+
+    def handle_rl_open_output_file(self, file_path_or_url: str, is_url=False, qurl=None):
+        if not file_path_or_url:
+            self._message_box(QMessageBox.Icon.Warning, "No Path", "No file path or URL provided.")
+            return
+        
+        if qurl is None: # Not parsed in advance (or invalid, in which case it is parsed again for the message)
+            qurl = self._output_qurl(file_path_or_url, is_url)
+            if qurl is None:
+                self._message_box(QMessageBox.Icon.Warning, "Invalid URL", f"The URL '{file_path_or_url}' is not valid.")
                 return
-            qurl = QUrl.fromLocalFile(file_path_or_url)
         
         if not QDesktopServices.openUrl(qurl):
-            QMessageBox.warning(self, "Open Failed", f"Could not open file/URL:\n{file_path_or_url}")
+            if not is_url and not os.path.exists(file_path_or_url): # Only stat on failure, for a clearer message
+                self._stat_cache.pop(file_path_or_url, None) # The previews shouldn't keep trusting a stale entry
+                self._message_box(QMessageBox.Icon.Warning, "File Not Found", f"The file\n{file_path_or_url}\nwas not found.")
+                return
+            self._message_box(QMessageBox.Icon.Warning, "Open Failed", f"Could not open file/URL:\n{file_path_or_url}")
 
     def handle_rl_save_notes(self):
         if self.selected_content_id_in_library is None:
-            QMessageBox.warning(self, "No Result Selected", "Please select a result to save notes for.")
+            self._message_box(QMessageBox.Icon.Warning, "No Result Selected", "Please select a result to save notes for.")
             return
         
         notes = self.rl_notes_edit_area.toPlainText()
         if results_manager.update_content_notes(self.selected_content_id_in_library, notes):
-            QMessageBox.information(self, "Success", "Notes updated successfully.")
-            # Re-select to refresh the view, which includes notes
-            current_selection = self.results_table_viewer.selectionModel().selectedRows()
-            self.handle_results_table_selection() # This will re-load and re-populate
-            if current_selection: # Try to restore selection if possible (might not be exact if list changes)
-                # This simple re-selection might not work perfectly if the table order changes.
-                # A more robust way would be to find the item by ID after reload.
-                self.results_table_viewer.selectRow(current_selection[0].row())
-
+            # Patch the cached page record instead of reloading it, so reselecting it shows the saved notes
+            if self._current_library_record is not None:
+                self._current_library_record['notes'] = notes
+            self.rl_notes_edit_area.document().setModified(False)
+            self._message_box(QMessageBox.Icon.Information, "Success", "Notes updated successfully.")
         else:
-            QMessageBox.critical(self, "Error", "Failed to update notes.")
+            self._message_box(QMessageBox.Icon.Critical, "Error", "Failed to update notes.")
 
     def handle_rl_delete_result(self):
         if self.selected_content_id_in_library is None:
-            QMessageBox.warning(self, "No Result Selected", "Please select a result to delete.")
+            self._message_box(QMessageBox.Icon.Warning, "No Result Selected", "Please select a result to delete.")
             return
 
-        confirm = QMessageBox.question(self, "Confirm Deletion",
-                                       f"Are you sure you want to delete result ID {self.selected_content_id_in_library}?",
-                                       QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        confirm = self._message_box(QMessageBox.Icon.Question, "Confirm Deletion",
+                                    f"Are you sure you want to delete result ID {self.selected_content_id_in_library}?",
+                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         
         if confirm == QMessageBox.StandardButton.Yes:
             if results_manager.delete_content(self.selected_content_id_in_library):
-                QMessageBox.information(self, "Success", f"Result ID {self.selected_content_id_in_library} deleted.")
+                self._drop_json_pretty(self.selected_content_id_in_library)
+                self._message_box(QMessageBox.Icon.Information, "Success", f"Result ID {self.selected_content_id_in_library} deleted.")
                 self.selected_content_id_in_library = None
                 self.rl_detail_area_group.setVisible(False)
                 self.load_results_from_db(page_to_load=self.current_results_page)
             else:
-                QMessageBox.critical(self, "Error", "Failed to delete result.")
+                self._message_box(QMessageBox.Icon.Critical, "Error", "Failed to delete result.")
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
@@ -1,17 +1,71 @@
 import sqlite3
 import json
+import threading
 from datetime import datetime
 
+try:
+    import orjson # Optional: re-indents json_data outputs several times faster than the json module
+except ImportError:
+    orjson = None
+
 DB_NAME = 'generated_content.db'
 TABLE_NAME = 'content_library'
 
+_thread_local = threading.local() # Each thread (GUI, pool workers) keeps its own persistent connection
+
+def _connect() -> sqlite3.Connection:
+    """
+    Returns this thread's persistent connection to DB_NAME, opening it on first use.
+    The connection is reopened if DB_NAME has been changed; call close_connection() before removing the file.
+    Use it as `with _connect() as conn:` - the block commits or rolls back but leaves it open.
+    """
+    conn = getattr(_thread_local, 'conn', None)
+    if conn is None or _thread_local.db_name != DB_NAME:
+        if conn is not None:
+            conn.close()
+        conn = sqlite3.connect(DB_NAME)
+        # WAL lets readers proceed while a write is in progress; NORMAL sync is durable enough under WAL
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        # Writers don't all go through init_db (e.g. the CLI), so an existing older table is upgraded here
+        try:
+            with conn:
+                _migrate(conn.cursor())
+        except sqlite3.Error as e:
+            print(f"Warning: Could not upgrade database '{DB_NAME}': {e}")
+        _thread_local.conn = conn
+        _thread_local.db_name = DB_NAME
+    return conn
+
+def close_connection():
+    """Closes this thread's persistent database connection, if one is open."""
+    conn = getattr(_thread_local, 'conn', None)
+    if conn is not None:
+        conn.close()
+        _thread_local.conn = None
+
+def _migrate(cursor):
+    """Brings a content_library table created by an older version up to date. Safe to run repeatedly."""
+    existing_columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({TABLE_NAME})")}
+    if not existing_columns: # No table yet; init_db creates it and then calls this
+        return
+    # Databases created before output_data_display existed get the column added
+    if 'output_data_display' not in existing_columns:
+        cursor.execute(f"ALTER TABLE {TABLE_NAME} ADD COLUMN output_data_display TEXT")
+    # output_type is stored lowercase (see _normalize_output_type); older databases may hold mixed case
+    if cursor.execute("PRAGMA user_version").fetchone()[0] < 1:
+        cursor.execute(f"UPDATE {TABLE_NAME} SET output_type = lower(output_type) WHERE output_type <> lower(output_type)")
+        cursor.execute("PRAGMA user_version = 1")
+
 def init_db():
     """
     Initializes the SQLite database.
     Creates the content_library table if it doesn't exist.
     """
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with _connect() as conn:
             cursor = conn.cursor()
             cursor.execute(f'''
                 CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
@@ -22,9 +76,14 @@ def init_db():
                     output_type TEXT,
                     output_data TEXT NOT NULL,
                     parameters TEXT,
-                    notes TEXT
+                    notes TEXT,
+                    output_data_display TEXT
                 )
             ''')
+            _migrate(cursor) # No-op for a table just created; upgrades one made by an older version
+            # Serve the Results Library filters and its newest-first keyset pagination without full scans
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_content_filter ON {TABLE_NAME} (space_id, output_type, timestamp DESC)")
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_content_recent ON {TABLE_NAME} (timestamp DESC, id DESC)")
             conn.commit()
             print(f"Database '{DB_NAME}' initialized and table '{TABLE_NAME}' created/ensured.")
     except sqlite3.Error as e:
@@ -43,6 +102,27 @@ def _dict_factory(cursor, row):
             d['parameters'] = None # Or some other default
     return d
 
+def _normalize_output_type(output_type: str | None) -> str | None:
+    """Output types are stored lowercase, so readers can compare them without calling .lower()."""
+    return output_type.lower() if output_type else output_type
+
+DISPLAY_FORM_MAX_CHARS = 2_000_000 # Larger json_data outputs get no display form; viewers show them as stored
+
+def _display_form(output_type: str, output_data) -> str | None:
+    """
+    Returns the indented form of a json_data output for display, or None for other
+    output types and for data that isn't valid JSON. Computed once on insert so
+    viewers don't have to re-parse the output every time it is shown.
+    """
+    if output_type != 'json_data' or not isinstance(output_data, str) or len(output_data) > DISPLAY_FORM_MAX_CHARS:
+        return None
+    try:
+        if orjson:
+            return orjson.dumps(orjson.loads(output_data), option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(json.loads(output_data), indent=2, ensure_ascii=False)
+    except (ValueError, TypeError): # orjson's decode/encode errors subclass these too
+        return None
+
 def add_content(space_id: str, task_description: str, output_type: str, output_data: str, parameters: dict, notes: str = None) -> int | None:
     """
     Adds a new content record to the database.
@@ -58,20 +138,51 @@ def add_content(space_id: str, task_description: str, output_type: str, output_d
     Returns:
         The ID of the newly inserted row, or None on error.
     """
+    output_type = _normalize_output_type(output_type)
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with _connect() as conn:
             cursor = conn.cursor()
             params_json = json.dumps(parameters)
             cursor.execute(f'''
-                INSERT INTO {TABLE_NAME} (space_id, task_description, output_type, output_data, parameters, notes, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (space_id, task_description, output_type, output_data, params_json, notes, datetime.now()))
+                INSERT INTO {TABLE_NAME} (space_id, task_description, output_type, output_data, parameters, notes, timestamp, output_data_display)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (space_id, task_description, output_type, output_data, params_json, notes, datetime.now(),
+                  _display_form(output_type, output_data)))
             conn.commit()
             return cursor.lastrowid
     except sqlite3.Error as e:
         print(f"Error adding content: {e}")
         return None
 
+def add_content_many(rows: list[dict]) -> int | None:
+    """
+    Adds many content records to the database in a single transaction.
+
+    Args:
+        rows: Records to insert. Each is a dict with the same keys as the
+              add_content arguments (space_id, task_description, output_type,
+              output_data, parameters and optionally notes).
+
+    Returns:
+        The number of inserted rows, or None on error.
+    """
+    if not rows:
+        return 0
+    try:
+        with _connect() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(f'''
+                INSERT INTO {TABLE_NAME} (space_id, task_description, output_type, output_data, parameters, notes, timestamp, output_data_display)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [(row['space_id'], row['task_description'], _normalize_output_type(row['output_type']), row['output_data'],
+                   json.dumps(row['parameters']), row.get('notes'), datetime.now(),
+                   _display_form(_normalize_output_type(row['output_type']), row['output_data'])) for row in rows])
+            conn.commit()
+            return cursor.rowcount
+    except sqlite3.Error as e:
+        print(f"Error adding content batch: {e}")
+        return None
+
 def get_content_by_id(content_id: int) -> dict | None:
     """
     Fetches a content record by its ID.
@@ -83,9 +194,9 @@ def get_content_by_id(content_id: int) -> dict | None:
         A dictionary representing the record, or None if not found or on error.
     """
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            conn.row_factory = _dict_factory
+        with _connect() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = _dict_factory # Per cursor; the connection is shared
             cursor.execute(f"SELECT * FROM {TABLE_NAME} WHERE id = ?", (content_id,))
             record = cursor.fetchone()
             return record
@@ -93,6 +204,27 @@ def get_content_by_id(content_id: int) -> dict | None:
         print(f"Error getting content by ID {content_id}: {e}")
         return None
 
+def iter_all_content(limit: int = 20, offset: int = 0):
+    """
+    Lazily yields content records with pagination, one row at a time.
+
+    Args:
+        limit: Maximum number of records to yield.
+        offset: Number of records to skip.
+
+    Yields:
+        A dictionary for each record, newest first.
+    """
+    try:
+        with _connect() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = _dict_factory # Per cursor; the connection is shared
+            cursor.execute(f"SELECT * FROM {TABLE_NAME} ORDER BY timestamp DESC LIMIT ? OFFSET ?", (limit, offset))
+            for record in cursor:
+                yield record
+    except sqlite3.Error as e:
+        print(f"Error getting all content: {e}")
+
 def get_all_content(limit: int = 20, offset: int = 0) -> list[dict]:
     """
     Fetches all content records with pagination.
@@ -104,18 +236,58 @@ def get_all_content(limit: int = 20, offset: int = 0) -> list[dict]:
     Returns:
         A list of dictionaries, where each dictionary is a record.
     """
+    return list(iter_all_content(limit=limit, offset=offset))
+
+def _build_filter_clause(output_type: str = None, space_id: str = None, task_keyword: str = None) -> tuple[str, list]:
+    """Builds the WHERE clause and its parameters for the content filters."""
+    query = "WHERE 1=1"
+    params = []
+
+    if output_type:
+        query += " AND output_type = ?"
+        params.append(_normalize_output_type(output_type))
+    if space_id:
+        query += " AND space_id = ?"
+        params.append(space_id)
+    if task_keyword:
+        query += " AND task_description LIKE ?"
+        params.append(f"%{task_keyword}%")
+    return query, params
+
+def iter_filter_content(output_type: str = None, space_id: str = None, task_keyword: str = None, limit: int = 20, offset: int = 0, after: tuple | None = None):
+    """
+    Lazily yields content records matching the given criteria, one row at a time.
+
+    Args:
+        output_type: Filter by output type.
+        space_id: Filter by Space ID.
+        task_keyword: Filter by a keyword in the task description (uses LIKE).
+        limit: Maximum number of records to yield.
+        offset: Number of records to skip.
+        after: Optional (timestamp, id) of the last row of the previous page (see iter_content_summary).
+
+    Yields:
+        A dictionary for each matching record, newest first.
+    """
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            conn.row_factory = _dict_factory
+        with _connect() as conn:
             cursor = conn.cursor()
-            cursor.execute(f"SELECT * FROM {TABLE_NAME} ORDER BY timestamp DESC LIMIT ? OFFSET ?", (limit, offset))
-            records = cursor.fetchall()
-            return records
+            cursor.row_factory = _dict_factory # Per cursor; the connection is shared
+            
+            where_clause, params = _build_filter_clause(output_type, space_id, task_keyword)
+            if after is not None:
+                where_clause += " AND (timestamp, id) < (?, ?)"
+                params.extend(after)
+            query = f"SELECT * FROM {TABLE_NAME} {where_clause} ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+            
+            cursor.execute(query, tuple(params))
+            for record in cursor:
+                yield record
     except sqlite3.Error as e:
-        print(f"Error getting all content: {e}")
-        return []
+        print(f"Error filtering content: {e}")
 
-def filter_content(output_type: str = None, space_id: str = None, task_keyword: str = None, limit: int = 20, offset: int = 0) -> list[dict]:
+def filter_content(output_type: str = None, space_id: str = None, task_keyword: str = None, limit: int = 20, offset: int = 0, after: tuple | None = None) -> list[dict]:
     """
     Filters content records based on criteria with pagination.
 
@@ -125,37 +297,97 @@ def filter_content(output_type: str = None, space_id: str = None, task_keyword:
         task_keyword: Filter by a keyword in the task description (uses LIKE).
         limit: Maximum number of records to return.
         offset: Number of records to skip.
+        after: Optional (timestamp, id) of the last row of the previous page (see iter_content_summary).
 
     Returns:
         A list of matching records as dictionaries.
     """
+    return list(iter_filter_content(output_type=output_type, space_id=space_id, task_keyword=task_keyword, limit=limit, offset=offset, after=after))
+
+def iter_content_summary(limit: int = 20, offset: int = 0, output_type: str = None, space_id: str = None, task_keyword: str = None, task_preview_len: int = 50, after: tuple | None = None):
+    """
+    Lazily yields lightweight summary rows for listing content, optionally filtered.
+    Only the listed columns are read, so large output_data/parameters values are never loaded.
+
+    Args:
+        limit: Maximum number of records to yield.
+        offset: Number of records to skip.
+        output_type: Filter by output type.
+        space_id: Filter by Space ID.
+        task_keyword: Filter by a keyword in the task description (uses LIKE).
+        task_preview_len: Number of characters of the task description to return.
+        after: Optional (timestamp, id) of the last row of the previous page. Only rows
+               that sort after it are returned (keyset pagination), so deep pages
+               don't have to skip over earlier rows like a large offset does.
+
+    Yields:
+        (id, space_id, output_type, task_preview, timestamp) tuples, newest first.
+    """
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            conn.row_factory = _dict_factory
+        with _connect() as conn:
             cursor = conn.cursor()
-            
-            query = f"SELECT * FROM {TABLE_NAME} WHERE 1=1"
-            params = []
-
-            if output_type:
-                query += " AND output_type = ?"
-                params.append(output_type)
-            if space_id:
-                query += " AND space_id = ?"
-                params.append(space_id)
-            if task_keyword:
-                query += " AND task_description LIKE ?"
-                params.append(f"%{task_keyword}%")
-            
-            query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
-            
-            cursor.execute(query, tuple(params))
-            records = cursor.fetchall()
-            return records
+            where_clause, params = _build_filter_clause(output_type, space_id, task_keyword)
+            if after is not None:
+                where_clause += " AND (timestamp, id) < (?, ?)"
+                params.extend(after)
+            query = (f"SELECT id, space_id, output_type, substr(task_description, 1, ?), timestamp FROM {TABLE_NAME} "
+                     f"{where_clause} ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?")
+            cursor.execute(query, (task_preview_len, *params, limit, offset))
+            yield from cursor
     except sqlite3.Error as e:
-        print(f"Error filtering content: {e}")
-        return []
+        print(f"Error getting content summary: {e}")
+
+def iter_content_metadata(limit: int = 20, offset: int = 0, output_type: str = None, space_id: str = None, task_keyword: str = None, after: tuple | None = None):
+    """
+    Lazily yields content records without their output_data, optionally filtered.
+    Use this for listings that show record details up front and load the (possibly
+    large) output on demand with get_content_output.
+
+    Args:
+        limit: Maximum number of records to yield.
+        offset: Number of records to skip.
+        output_type: Filter by output type.
+        space_id: Filter by Space ID.
+        task_keyword: Filter by a keyword in the task description (uses LIKE).
+        after: Optional (timestamp, id) of the last row of the previous page (see iter_content_summary).
+
+    Yields:
+        A dictionary for each record with every column except output_data, newest first.
+    """
+    try:
+        with _connect() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = _dict_factory # Per cursor; the connection is shared
+            where_clause, params = _build_filter_clause(output_type, space_id, task_keyword)
+            if after is not None:
+                where_clause += " AND (timestamp, id) < (?, ?)"
+                params.extend(after)
+            query = (f"SELECT id, space_id, task_description, timestamp, output_type, parameters, notes FROM {TABLE_NAME} "
+                     f"{where_clause} ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?")
+            cursor.execute(query, (*params, limit, offset))
+            yield from cursor
+    except sqlite3.Error as e:
+        print(f"Error getting content metadata: {e}")
+
+def get_content_output(content_id: int) -> tuple[str, str | None] | None:
+    """
+    Fetches the output columns of a content record.
+
+    Args:
+        content_id: The ID of the content.
+
+    Returns:
+        An (output_data, output_data_display) tuple, where output_data_display is the
+        pre-formatted json_data text or None, or None if not found or on error.
+    """
+    try:
+        with _connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT output_data, output_data_display FROM {TABLE_NAME} WHERE id = ?", (content_id,))
+            return cursor.fetchone()
+    except sqlite3.Error as e:
+        print(f"Error getting output for ID {content_id}: {e}")
+        return None
 
 def update_content_notes(content_id: int, notes: str) -> bool:
     """
@@ -169,7 +401,7 @@ def update_content_notes(content_id: int, notes: str) -> bool:
         True on success, False on error or if the record doesn't exist.
     """
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with _connect() as conn:
             cursor = conn.cursor()
             cursor.execute(f"UPDATE {TABLE_NAME} SET notes = ? WHERE id = ?", (notes, content_id))
             conn.commit()
@@ -189,7 +421,7 @@ def delete_content(content_id: int) -> bool:
         True on success, False on error or if the record doesn't exist.
     """
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with _connect() as conn:
             cursor = conn.cursor()
             cursor.execute(f"DELETE FROM {TABLE_NAME} WHERE id = ?", (content_id,))
             conn.commit()
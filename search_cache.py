@@ -0,0 +1,81 @@
+import hashlib
+import json
+import sqlite3
+import time
+from types import SimpleNamespace
+
+import space_finder
+
+CACHE_DB_NAME = 'search_cache.db'
+CACHE_TABLE_NAME = 'space_search_cache'
+DEFAULT_TTL = 300 # Seconds a cached search stays fresh
+CACHED_FIELDS = ('id', 'author', 'likes', 'pipeline_tag') # SpaceInfo attributes the search results table shows
+
+def _cache_key(task_description: str, sort_by: str, limit: int) -> str:
+    """Returns a fixed-length key for a (task, sort_by, limit) search."""
+    return hashlib.blake2b(f"{task_description}|{sort_by}|{limit}".encode(), digest_size=16).hexdigest()
+
+def _to_record(space) -> dict:
+    """Returns the cached fields of a SpaceInfo as a JSON-ready dict; missing or None attributes are left out."""
+    record = {field: value for field in CACHED_FIELDS if (value := getattr(space, field, None)) is not None}
+    card_data = getattr(space, 'cardData', None)
+    if isinstance(card_data, dict) and card_data.get('tags'):
+        record['cardData'] = {'tags': card_data['tags']} # Only the tags are shown
+    return record
+
+def _ensure_table(conn):
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS {CACHE_TABLE_NAME} (
+            key TEXT PRIMARY KEY,
+            created REAL NOT NULL,
+            payload TEXT NOT NULL
+        )
+    ''')
+
+def cached_find_spaces(task_description: str, sort_by: str = 'likes', limit: int = 10, ttl: float = DEFAULT_TTL):
+    """
+    Same as space_finder.find_spaces, but serves repeat searches from a local SQLite cache.
+
+    Args:
+        task_description: The description of the task to search for.
+        sort_by: The field to sort the results by. Defaults to 'likes'.
+        limit: The maximum number of results to return. Defaults to 10.
+        ttl: Seconds a cached result stays valid. Defaults to DEFAULT_TTL.
+
+    Returns:
+        A list of SpaceInfo objects matching the search criteria. Results served from the cache
+        are SimpleNamespace objects carrying only CACHED_FIELDS and cardData tags.
+    """
+    key = _cache_key(task_description, sort_by, limit)
+    try:
+        with sqlite3.connect(CACHE_DB_NAME) as conn:
+            _ensure_table(conn)
+            row = conn.execute(f"SELECT created, payload FROM {CACHE_TABLE_NAME} WHERE key = ?", (key,)).fetchone()
+        if row and time.time() - row[0] < ttl:
+            return [SimpleNamespace(**record) for record in json.loads(row[1])]
+    except (sqlite3.Error, ValueError, TypeError) as e: # An unreadable entry is a miss and gets overwritten below
+        print(f"Warning: Could not read search cache: {e}")
+
+    # list() consumes the lazy list_spaces iterator so the full result can be stored
+    spaces = list(space_finder.find_spaces(task_description=task_description, sort_by=sort_by, limit=limit))
+
+    try:
+        with sqlite3.connect(CACHE_DB_NAME) as conn:
+            _ensure_table(conn)
+            conn.execute(f"INSERT OR REPLACE INTO {CACHE_TABLE_NAME} (key, created, payload) VALUES (?, ?, ?)",
+                         (key, time.time(), json.dumps([_to_record(space) for space in spaces], default=str)))
+            conn.commit()
+    except (sqlite3.Error, TypeError, ValueError) as e:
+        print(f"Warning: Could not write search cache: {e}")
+
+    return spaces
+
+def clear_search_cache():
+    """Removes all cached search results."""
+    try:
+        with sqlite3.connect(CACHE_DB_NAME) as conn:
+            _ensure_table(conn)
+            conn.execute(f"DELETE FROM {CACHE_TABLE_NAME}")
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"Error clearing search cache: {e}")
@@ -2,8 +2,13 @@ import gradio_client
 import io
 import os
 import sys
+import threading
 from gradio_client.client import Job # For type hinting
 
+# view_api() prints its output, and swapping sys.stdout to capture it is process-wide:
+# overlapping captures (e.g. from GUI worker threads) would restore each other's StringIO
+_stdout_capture_lock = threading.Lock()
+
 def get_space_api_details(space_id: str, hf_token: str | None = None) -> str | None:
     """
     Retrieves the API details of a Hugging Face Space.
@@ -22,18 +27,19 @@ def get_space_api_details(space_id: str, hf_token: str | None = None) -> str | N
         print(f"Error initializing client for Space '{space_id}': {e}")
         return None
 
-    # Redirect stdout to capture the output of view_api()
-    old_stdout = sys.stdout
-    sys.stdout = captured_output = io.StringIO()
-    try:
-        client.view_api(all_endpoints=True)
-        api_details = captured_output.getvalue()
-    except Exception as e:
-        print(f"Error fetching API details for Space '{space_id}': {e}")
-        api_details = None
-    finally:
-        sys.stdout = old_stdout # Restore stdout
-        captured_output.close()
+    # Redirect stdout to capture the output of view_api(), one capture at a time
+    with _stdout_capture_lock:
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = io.StringIO()
+        try:
+            client.view_api(all_endpoints=True)
+            api_details = captured_output.getvalue()
+        except Exception as e:
+            print(f"Error fetching API details for Space '{space_id}': {e}")
+            api_details = None
+        finally:
+            sys.stdout = old_stdout # Restore stdout
+            captured_output.close()
     return api_details
 
 def run_space_predict(space_id: str, api_name: str, *args, hf_token: str | None = None) -> any:
@@ -0,0 +1,328 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import contextlib
+import io
+import math
+import os
+import sys
+import tempfile
+
+# Adjust the import path if your project structure requires it
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import app
+import results_manager
+
+class TestParseRunParams(unittest.TestCase):
+
+    def test_decoded_types(self):
+        """Values decode to the same types and values as json.loads, whichever JSON library is in use."""
+        args, kwargs = app.parse_run_params([
+            '5', '-2', '1.5', 'true', 'null', '"quoted"', 'plain text',
+            'n=123456789012345678901234567890', 'neg=-9223372036854775809', 'big=1e400', 'nested=[18446744073709551616]',
+        ])
+
+        self.assertEqual(args, [5, -2, 1.5, True, None, "quoted", "plain text"])
+        self.assertEqual([type(arg) for arg in args[:3]], [int, int, float])
+        self.assertEqual(kwargs['n'], 123456789012345678901234567890)
+        self.assertIsInstance(kwargs['n'], int, "Integers beyond 64 bits should stay exact ints.")
+        self.assertEqual(kwargs['neg'], -9223372036854775809)
+        self.assertIsInstance(kwargs['neg'], int)
+        self.assertEqual(kwargs['big'], float('inf'))
+        self.assertEqual(kwargs['nested'], [18446744073709551616])
+        self.assertIsInstance(kwargs['nested'][0], int)
+
+    def test_values_json_loads_accepts_are_decoded(self):
+        """Surrounding whitespace and the NaN/Infinity literals are decoded like json.loads; empty or other text stays a string."""
+        args, kwargs = app.parse_run_params(['NaN', 'Infinity', '-Infinity', 'n= 5', 'l=\t[1, 2] ', 'e=', 'w= hello'])
+
+        self.assertTrue(math.isnan(args[0]))
+        self.assertEqual(args[1:], [float('inf'), float('-inf')])
+        self.assertEqual(kwargs['n'], 5)
+        self.assertEqual(kwargs['l'], [1, 2])
+        self.assertEqual(kwargs['e'], "")
+        self.assertEqual(kwargs['w'], " hello", "Text that isn't JSON should be passed through unchanged.")
+
+    def test_container_values_are_not_shared(self):
+        """Parsing the same list/dict value twice gives independent objects, so mutating one can't affect later calls."""
+        first = app.parse_run_params(['k=[1]', '{"a": [1]}'])
+        first[1]['k'].append(2)
+        first[0][0]['a'].append(2)
+
+        second = app.parse_run_params(['k=[1]', '{"a": [1]}'])
+        self.assertEqual(second[1]['k'], [1])
+        self.assertEqual(second[0][0], {"a": [1]})
+
+    def test_file_extension_check(self):
+        """File extensions match case-insensitively; dotted text and values without an extension don't."""
+        self.assertTrue(app._has_file_ext("photo.png"))
+        self.assertTrue(app._has_file_ext("photo.PNG"))
+        self.assertTrue(app._has_file_ext("clip.Mp4"))
+        self.assertTrue(app._has_file_ext("dir.v2/scene.GlTf"))
+        self.assertFalse(app._has_file_ext("version 1.2.3"))
+        self.assertFalse(app._has_file_ext("example.com"))
+        self.assertFalse(app._has_file_ext("README"))
+        self.assertFalse(app._has_file_ext("png"))
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            _, kwargs = app.parse_run_params(['image=missing.PNG', 'v=1.2.3'])
+        self.assertEqual(kwargs['image'], "missing.PNG")
+        self.assertIn("File path 'missing.PNG' for key 'image' does not exist", output.getvalue())
+        self.assertEqual(kwargs['v'], "1.2.3")
+
+class TestMainParser(unittest.TestCase):
+
+    def _main_exit(self, *argv):
+        """Runs app.main(argv), which is expected to exit; returns (exit code, stdout, stderr)."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr), \
+                self.assertRaises(SystemExit) as raised:
+            app.main(list(argv))
+        return raised.exception.code, stdout.getvalue(), stderr.getvalue()
+
+    def test_top_level_help_lists_every_command(self):
+        """--help builds every command's parser, so all of them are listed."""
+        for flag in ('--help', '-h'):
+            with self.subTest(flag=flag):
+                code, stdout, _ = self._main_exit(flag)
+                self.assertEqual(code, 0)
+                self.assertIn("{search,favorites,run,results}", stdout)
+
+    def test_unknown_command(self):
+        """An unknown command is an argparse error that names every valid command."""
+        code, stdout, stderr = self._main_exit('bogus')
+        self.assertEqual(code, 2)
+        self.assertEqual(stdout, "")
+        self.assertIn("invalid choice: 'bogus'", stderr)
+        for command in ('search', 'favorites', 'run', 'results'):
+            self.assertIn(f"'{command}'", stderr)
+
+    def test_missing_command(self):
+        code, _, stderr = self._main_exit()
+        self.assertEqual(code, 2)
+        self.assertIn("required: command", stderr)
+
+    def test_subcommand_help(self):
+        """Help for a command or one of its subcommands comes from the partially built parser."""
+        code, stdout, _ = self._main_exit('results', '--help')
+        self.assertEqual(code, 0)
+        self.assertIn("{list,add,view,filter,update,delete,initdb}", stdout)
+
+        code, stdout, _ = self._main_exit('run', 'predict-batch', '--help')
+        self.assertEqual(code, 0)
+        self.assertIn("--manifest", stdout)
+        self.assertIn("--batch-size", stdout)
+
+        code, _, stderr = self._main_exit('results')
+        self.assertEqual(code, 2)
+        self.assertIn("required: res_subcommand", stderr)
+
+class _CliTestCase(unittest.TestCase):
+    """Runs app.main against a throwaway results database, with space_runner mocked."""
+
+    def setUp(self):
+        """Use a throwaway results database and a mocked space_runner for each test."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.original_db_name = results_manager.DB_NAME
+        results_manager.close_connection()
+        results_manager.DB_NAME = os.path.join(self.temp_dir.name, 'test_cli.db')
+        results_manager.init_db()
+
+        self.space_runner = MagicMock()
+        self.space_runner.run_space_predict.side_effect = lambda space_id, api_name, *args, **kwargs: f"result for {args}"
+        self.modules_patcher = patch.dict(sys.modules, {'space_runner': self.space_runner})
+        self.modules_patcher.start()
+
+    def tearDown(self):
+        self.modules_patcher.stop()
+        results_manager.close_connection()
+        results_manager.DB_NAME = self.original_db_name
+        self.temp_dir.cleanup()
+
+    def _run(self, *argv):
+        """Runs the CLI with argv and returns what it printed."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            app.main(list(argv))
+        return output.getvalue()
+
+class TestRunPredict(_CliTestCase):
+
+    def test_saved_result_reuses_printed_json(self):
+        """A structured result is serialized once: the printed JSON is what gets saved."""
+        self.space_runner.run_space_predict.side_effect = None
+        self.space_runner.run_space_predict.return_value = {"labels": ["cat"], "score": 0.5}
+
+        with patch.object(app, '_dumps', side_effect=AssertionError("serialized twice")):
+            output = self._run('run', 'predict', 'user/space', '/predict', '--output_type_for_db', 'json_data')
+
+        pretty = app._dumps_pretty({"labels": ["cat"], "score": 0.5})
+        self.assertIn(pretty, output)
+        self.assertEqual(results_manager.get_all_content()[0]['output_data'], pretty)
+
+class TestResultsListAndFilter(_CliTestCase):
+
+    def _seed(self):
+        """Adds three records and returns their expected output lines, newest first."""
+        rows = [("user/img", "Draw a cat " * 10, "image_path"), ("user/txt", "Translate", "text"), ("user/img", "Draw a dog", "image_path")]
+        lines = []
+        for space_id, task, output_type in rows:
+            content_id = results_manager.add_content(space_id, task, output_type, "data", {})
+            timestamp = results_manager.get_content_by_id(content_id)['timestamp']
+            lines.append(f"  ID: {content_id}, Space: {space_id}, Type: {output_type}, Task: {task[:50]}..., Timestamp: {timestamp}")
+        return lines[::-1]
+
+    def test_list_output(self):
+        lines = self._seed()
+        output = self._run('results', 'list', '--limit', '2', '--offset', '1')
+        self.assertEqual(output, "\n".join(["Fetching results with limit: 2, offset: 1", "Generated Content:", *lines[1:3]]) + "\n")
+
+    def test_output_written_in_chunks_matches(self):
+        """Rows spread over several buffered writes come out exactly as one write would."""
+        lines = self._seed()
+        with patch.object(app, '_ROWS_PER_WRITE', 2):
+            output = self._run('results', 'list')
+        self.assertEqual(output, "\n".join(["Fetching results with limit: 20, offset: 0", "Generated Content:", *lines]) + "\n")
+
+    def test_filter_output(self):
+        lines = self._seed()
+        output = self._run('results', 'filter', '--type', 'image_path', '--space_id', 'user/img')
+        self.assertEqual(output, "\n".join([
+            "Filtering results by Type: image_path, Space ID: user/img, Task Keyword: None, Limit: 20, Offset: 0",
+            "Filtered Results:", lines[0], lines[2]]) + "\n")
+
+    def test_empty_results(self):
+        self.assertEqual(self._run('results', 'list'),
+                         "Fetching results with limit: 20, offset: 0\nNo results found.\n")
+        self._seed()
+        self.assertEqual(self._run('results', 'filter', '--task_keyword', 'zebra'),
+                         "Filtering results by Type: None, Space ID: None, Task Keyword: zebra, Limit: 20, Offset: 0\n"
+                         "No results found matching your filter criteria.\n")
+
+class TestResultsDelete(_CliTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.content_id = results_manager.add_content("user/space", "Task", "text", "hi", {})
+
+    def test_yes_skips_confirmation(self):
+        """--yes/-y deletes without prompting."""
+        for flag in ('--yes', '-y'):
+            with self.subTest(flag=flag), patch('builtins.input') as mock_input:
+                content_id = results_manager.add_content("user/space", "Task", "text", "hi", {})
+                output = self._run('results', 'delete', str(content_id), flag)
+                mock_input.assert_not_called()
+                self.assertIn(f"Result ID: {content_id} deleted successfully.", output)
+                self.assertIsNone(results_manager.get_content_by_id(content_id))
+
+    def test_prompts_without_yes(self):
+        """Without --yes the user is asked, and only 'yes' deletes."""
+        with patch('builtins.input', return_value='no') as mock_input:
+            output = self._run('results', 'delete', str(self.content_id))
+        mock_input.assert_called_once()
+        self.assertIn("Deletion cancelled.", output)
+        self.assertIsNotNone(results_manager.get_content_by_id(self.content_id))
+
+        with patch('builtins.input', return_value='yes') as mock_input:
+            self._run('results', 'delete', str(self.content_id))
+        mock_input.assert_called_once()
+        self.assertIsNone(results_manager.get_content_by_id(self.content_id))
+
+class TestRunPredictBatch(_CliTestCase):
+
+    def _run_batch(self, manifest_lines, *extra_args):
+        """Writes the manifest, runs 'run predict-batch' on it and returns what it printed."""
+        manifest_path = os.path.join(self.temp_dir.name, 'manifest.jsonl')
+        with open(manifest_path, 'w') as f:
+            f.write("\n".join(manifest_lines) + "\n")
+        return self._run('run', 'predict-batch', '--manifest', manifest_path, *extra_args)
+
+    def test_manifest_parsing(self):
+        """Blank lines are ignored; invalid JSON and entries missing space_id or api_name count as failures."""
+        output = self._run_batch([
+            '{"space_id": "user/a", "api_name": "/predict", "params": ["1"], "task_desc": "first"}',
+            '',
+            '   ',
+            'not json',
+            '{"api_name": "/predict"}',
+            '{"space_id": "user/b"}',
+            '["user/c", "/predict"]',
+            '{"space_id": "user/d", "api_name": "/predict", "output_type_for_db": "text"}',
+        ])
+
+        self.assertIn("Batch complete: 2 results saved, 4 failed.", output)
+        self.assertEqual(self.space_runner.run_space_predict.call_count, 2)
+        records = results_manager.get_all_content()
+        by_space = {record['space_id']: record for record in records}
+        self.assertEqual(set(by_space), {"user/a", "user/d"})
+        self.assertEqual(by_space["user/a"]["task_description"], "first")
+        self.assertEqual(by_space["user/a"]["output_type"], "other", "--output_type_for_db default should apply.")
+        self.assertEqual(by_space["user/d"]["task_description"], "user/d", "Task should default to the Space ID.")
+        self.assertEqual(by_space["user/d"]["output_type"], "text")
+
+    def test_params_must_be_list_of_strings_or_object(self):
+        """Rows whose params aren't a list of strings or an object are reported by line number and counted as failed."""
+        output = self._run_batch([
+            '{"space_id": "user/str", "api_name": "/predict", "params": "text=Hello"}',
+            '{"space_id": "user/num", "api_name": "/predict", "params": 5}',
+            '{"space_id": "user/mixed", "api_name": "/predict", "params": ["a=1", 2]}',
+            '{"space_id": "user/list", "api_name": "/predict", "params": ["text=Hello", "3"]}',
+            '{"space_id": "user/dict", "api_name": "/predict", "params": {"text": "Hello", "steps": 3}}',
+        ])
+
+        self.assertIn("Skipping invalid manifest line 1: 'params' must be a list of strings or an object, got str", output)
+        self.assertIn("Skipping invalid manifest line 2: 'params' must be a list of strings or an object, got int", output)
+        self.assertIn("Skipping invalid manifest line 3: 'params' must be a list of strings or an object, got list", output)
+        self.assertIn("Batch complete: 2 results saved, 3 failed.", output)
+        calls = self.space_runner.run_space_predict.call_args_list
+        self.assertEqual([call.args for call in calls], [("user/list", "/predict", 3), ("user/dict", "/predict")])
+        self.assertEqual(calls[0].kwargs, {'text': "Hello", 'hf_token': app._HF_TOKEN})
+        self.assertEqual(calls[1].kwargs, {'text': "Hello", 'steps': 3, 'hf_token': app._HF_TOKEN})
+
+    def test_flushes_at_batch_size(self):
+        """Rows are written in batches of --batch-size, with the remainder flushed at the end."""
+        lines = [f'{{"space_id": "user/s{i}", "api_name": "/predict"}}' for i in range(5)]
+        batch_sizes = [] # Recorded at call time; the handler reuses (and clears) its pending list
+        add_content_many = results_manager.add_content_many
+        def record_batch(rows):
+            batch_sizes.append(len(rows))
+            return add_content_many(rows)
+        with patch.object(results_manager, 'add_content_many', side_effect=record_batch):
+            output = self._run_batch(lines, '--batch-size', '2')
+
+        self.assertEqual(batch_sizes, [2, 2, 1])
+        self.assertIn("Batch complete: 5 results saved, 0 failed.", output)
+        self.assertEqual(len(results_manager.get_all_content(limit=10)), 5)
+
+    def test_saved_and_failed_counts(self):
+        """Predictions that raise or return None are counted as failed; failed batch writes aren't counted as saved."""
+        def run_space_predict(space_id, api_name, *args, **kwargs):
+            if space_id == "user/raises":
+                raise RuntimeError("boom")
+            return None if space_id == "user/none" else "ok"
+        self.space_runner.run_space_predict.side_effect = run_space_predict
+
+        output = self._run_batch([
+            '{"space_id": "user/ok1", "api_name": "/predict"}',
+            '{"space_id": "user/raises", "api_name": "/predict"}',
+            '{"space_id": "user/none", "api_name": "/predict"}',
+            '{"space_id": "user/ok2", "api_name": "/predict"}',
+        ])
+        self.assertIn("Batch complete: 2 results saved, 2 failed.", output)
+
+        with patch.object(results_manager, 'add_content_many', return_value=None):
+            output = self._run_batch(['{"space_id": "user/ok3", "api_name": "/predict"}'])
+        self.assertIn("Failed to save 1 results to database.", output)
+        self.assertIn("Batch complete: 0 results saved, 0 failed.", output)
+
+    def test_batch_size_must_be_positive(self):
+        """--batch-size below 1 is rejected by argparse before anything runs."""
+        for batch_size in ('0', '-3'):
+            with self.subTest(batch_size=batch_size), contextlib.redirect_stderr(io.StringIO()), \
+                    self.assertRaises(SystemExit):
+                self._run_batch(['{"space_id": "user/a", "api_name": "/predict"}'], '--batch-size', batch_size)
+        self.space_runner.run_space_predict.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -30,6 +30,7 @@ class TestResultsManager(unittest.TestCase):
         Tear down after all tests in the class.
         Restore original DB_NAME.
         """
+        results_manager.close_connection()
         results_manager.DB_NAME = cls.ORIGINAL_DB_NAME
         if os.path.exists(cls.TEST_DB_NAME):
             os.remove(cls.TEST_DB_NAME) # Clean up at the very end
@@ -39,6 +40,7 @@ class TestResultsManager(unittest.TestCase):
         Set up for each test method.
         Ensure the database file is deleted and re-initialized for a clean state.
         """
+        results_manager.close_connection() # Release the file (and its WAL side files) before removing it
         if os.path.exists(self.TEST_DB_NAME):
             os.remove(self.TEST_DB_NAME)
         results_manager.init_db() # Initialize DB for each test
@@ -48,6 +50,7 @@ class TestResultsManager(unittest.TestCase):
         Tear down after each test method.
         Deletes the test database file.
         """
+        results_manager.close_connection() # Release the file (and its WAL side files) before removing it
         if os.path.exists(self.TEST_DB_NAME):
             os.remove(self.TEST_DB_NAME)
 
@@ -274,6 +277,214 @@ class TestResultsManager(unittest.TestCase):
         # The _dict_factory json.loads("null") which becomes None.
         self.assertIsNone(retrieved_none_params['parameters'], "None parameters should be handled and retrieved as None.")
 
+    def test_08_iter_content(self):
+        """Test the lazy iterator variants yield the same records as the list functions."""
+        p = {"p": 1}
+        results_manager.add_content("space/images", "Generate cat image", "image_path", "/img/cat.png", p)
+        results_manager.add_content("space/text", "Translate English to French", "text", "Bonjour", p)
+
+        all_iter = results_manager.iter_all_content()
+        self.assertNotIsInstance(all_iter, list, "iter_all_content should be lazy.")
+        self.assertEqual(list(all_iter), results_manager.get_all_content())
+
+        filtered = list(results_manager.iter_filter_content(output_type="text"))
+        self.assertEqual(len(filtered), 1)
+        self.assertEqual(filtered[0]['output_data'], "Bonjour")
+        self.assertEqual(list(results_manager.iter_filter_content(task_keyword="nonexistent")), [])
+
+    def test_09_add_content_many(self):
+        """Test inserting several records in a single batch."""
+        rows = [
+            {"space_id": "s1", "task_description": "t1", "output_type": "text", "output_data": "d1", "parameters": {"a": 1}},
+            {"space_id": "s2", "task_description": "t2", "output_type": "text", "output_data": "d2", "parameters": {"b": 2}, "notes": "n2"},
+        ]
+        inserted = results_manager.add_content_many(rows)
+        self.assertEqual(inserted, 2)
+
+        all_content = results_manager.get_all_content()
+        self.assertEqual(len(all_content), 2)
+        by_space = {item['space_id']: item for item in all_content}
+        self.assertEqual(by_space["s1"]['parameters'], {"a": 1})
+        self.assertIsNone(by_space["s1"]['notes'])
+        self.assertEqual(by_space["s2"]['notes'], "n2")
+
+        self.assertEqual(results_manager.add_content_many([]), 0, "Empty batch should insert nothing.")
+
+    def test_10_iter_content_summary(self):
+        """Test summary rows contain only the listed columns, filtered and truncated."""
+        p = {"p": 1}
+        results_manager.add_content("space/images", "Generate cat image " + "x" * 100, "image_path", "/img/cat.png", p)
+        results_manager.add_content("space/text", "Translate English to French", "text", "Bonjour", p)
+
+        rows = list(results_manager.iter_content_summary())
+        self.assertEqual(len(rows), 2)
+        content_id, space_id, output_type, task_preview, timestamp = rows[0]
+        self.assertEqual((space_id, output_type, task_preview), ("space/text", "text", "Translate English to French"))
+        self.assertIsNotNone(timestamp)
+        self.assertEqual(len(rows[1][3]), 50, "Task description should be truncated to the preview length.")
+
+        filtered = list(results_manager.iter_content_summary(output_type="image_path", task_keyword="cat"))
+        self.assertEqual(len(filtered), 1)
+        self.assertEqual(filtered[0][1], "space/images")
+        self.assertEqual(list(results_manager.iter_content_summary(limit=1, offset=2)), [])
+
+    def test_11_content_summary_keyset_pagination(self):
+        """Test paging with the (timestamp, id) of the previous page's last row."""
+        p = {"p": 1}
+        for i in range(5):
+            results_manager.add_content(f"space/{i}", f"Task {i}", "text", f"out {i}", p)
+
+        pages = []
+        after = None
+        while True:
+            page = list(results_manager.iter_content_summary(limit=2, after=after))
+            if not page:
+                break
+            pages.append([row[1] for row in page])
+            after = (page[-1][4], page[-1][0])
+
+        self.assertEqual(pages, [["space/4", "space/3"], ["space/2", "space/1"], ["space/0"]])
+        self.assertEqual([row[1] for row in results_manager.iter_content_summary(limit=5)],
+                         ["space/4", "space/3", "space/2", "space/1", "space/0"])
+
+        first = results_manager.filter_content(output_type="text", limit=3)
+        rest = results_manager.filter_content(output_type="text", limit=3, after=(first[-1]['timestamp'], first[-1]['id']))
+        self.assertEqual([r['space_id'] for r in first + rest], ["space/4", "space/3", "space/2", "space/1", "space/0"])
+
+    def test_12_filter_indexes_created(self):
+        """Test init_db creates the indexes used by the library listing."""
+        with sqlite3.connect(self.TEST_DB_NAME) as conn:
+            names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertIn("idx_content_filter", names)
+        self.assertIn("idx_content_recent", names)
+
+    def test_13_content_metadata_and_output_data(self):
+        """Test metadata rows omit output_data, which is fetched separately."""
+        p = {"prompt": "a cat"}
+        content_id = results_manager.add_content("space/images", "Generate cat image", "image_path", "/img/cat.png", p, "nice")
+
+        rows = list(results_manager.iter_content_metadata(space_id="space/images"))
+        self.assertEqual(len(rows), 1)
+        record = rows[0]
+        self.assertNotIn("output_data", record)
+        self.assertEqual(record["id"], content_id)
+        self.assertEqual(record["parameters"], p, "Parameters should be decoded like get_content_by_id.")
+        self.assertEqual(record["notes"], "nice")
+        self.assertEqual(list(results_manager.iter_content_metadata(space_id="space/other")), [])
+
+        self.assertEqual(results_manager.get_content_output(content_id), ("/img/cat.png", None))
+        self.assertIsNone(results_manager.get_content_output(9999))
+
+    def test_14_persistent_connection(self):
+        """Test each thread reuses one WAL-mode connection across calls."""
+        import threading
+
+        conn = results_manager._connect()
+        self.assertIs(results_manager._connect(), conn)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+        other_thread_conns = []
+        def use_db_in_thread():
+            other_thread_conns.append(results_manager._connect())
+            results_manager.close_connection()
+        worker = threading.Thread(target=use_db_in_thread)
+        worker.start()
+        worker.join()
+        self.assertIsNot(other_thread_conns[0], conn, "Connections should not be shared between threads.")
+
+        content_id = results_manager.add_content("space/a", "Task", "text", "out", {})
+        self.assertIs(results_manager._connect(), conn)
+        self.assertIsNotNone(results_manager.get_content_by_id(content_id))
+
+    def test_15_json_output_display_form(self):
+        """Test json_data outputs get an indented display form on insert; other types don't."""
+        json_id = results_manager.add_content("space/json", "Task", "json_data", '{"a": [1, 2]}', {})
+        text_id = results_manager.add_content("space/text", "Task", "text", '{"a": 1}', {})
+        bad_id = results_manager.add_content("space/json", "Task", "json_data", "not json", {})
+        results_manager.add_content_many([
+            {"space_id": "space/batch", "task_description": "Task", "output_type": "json_data",
+             "output_data": '{"b": 2}', "parameters": {}},
+        ])
+
+        self.assertEqual(results_manager.get_content_output(json_id), ('{"a": [1, 2]}', json.dumps({"a": [1, 2]}, indent=2)))
+        self.assertEqual(results_manager.get_content_output(text_id), ('{"a": 1}', None))
+        self.assertEqual(results_manager.get_content_output(bad_id), ("not json", None))
+        batch_row = next(results_manager.iter_content_metadata(space_id="space/batch"))
+        self.assertEqual(results_manager.get_content_output(batch_row["id"])[1], json.dumps({"b": 2}, indent=2))
+        self.assertIsNone(results_manager.get_content_output(9999))
+
+        big_output = json.dumps(list(range(results_manager.DISPLAY_FORM_MAX_CHARS // 4)))
+        big_id = results_manager.add_content("space/json", "Task", "json_data", big_output, {})
+        self.assertIsNone(results_manager.get_content_output(big_id)[1], "Oversized outputs should not be re-indented.")
+
+    def test_16_init_db_adds_display_column(self):
+        """Test init_db adds output_data_display to a database created without it."""
+        results_manager.close_connection()
+        os.remove(self.TEST_DB_NAME)
+        with sqlite3.connect(self.TEST_DB_NAME) as conn:
+            conn.execute(f"""
+                CREATE TABLE {results_manager.TABLE_NAME} (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, space_id TEXT NOT NULL, task_description TEXT,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP, output_type TEXT, output_data TEXT NOT NULL,
+                    parameters TEXT, notes TEXT
+                )
+            """)
+        conn.close()
+
+        results_manager.init_db()
+        content_id = results_manager.add_content("space/json", "Task", "json_data", "[1]", {})
+        self.assertEqual(results_manager.get_content_output(content_id), ("[1]", "[\n  1\n]"))
+
+    def test_17_output_type_stored_lowercase(self):
+        """Test output types are lowercased on insert, in filters, and for rows saved before the change."""
+        results_manager.close_connection()
+        os.remove(self.TEST_DB_NAME)
+        with sqlite3.connect(self.TEST_DB_NAME) as conn:
+            conn.execute(f"""
+                CREATE TABLE {results_manager.TABLE_NAME} (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, space_id TEXT NOT NULL, task_description TEXT,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP, output_type TEXT, output_data TEXT NOT NULL,
+                    parameters TEXT, notes TEXT
+                )
+            """)
+            conn.execute(f"INSERT INTO {results_manager.TABLE_NAME} (space_id, output_type, output_data) VALUES ('old/space', 'Image_Path', 'a.png')")
+        conn.close()
+
+        results_manager.init_db()
+        new_id = results_manager.add_content("space/json", "Task", "JSON_Data", "[1]", {})
+        results_manager.add_content_many([{'space_id': "space/many", 'task_description': "Task",
+                                           'output_type': "TEXT", 'output_data': "hi", 'parameters': {}}])
+
+        self.assertEqual(results_manager.get_content_by_id(new_id)['output_type'], "json_data")
+        self.assertEqual(results_manager.get_content_output(new_id), ("[1]", "[\n  1\n]"))
+        self.assertEqual([r['space_id'] for r in results_manager.filter_content(output_type="image_path")], ["old/space"])
+        self.assertEqual([r['space_id'] for r in results_manager.filter_content(output_type="Text")], ["space/many"])
+
+    def test_18_writes_upgrade_old_schema_without_init_db(self):
+        """Test writers work on a database from before output_data_display, without init_db being called."""
+        results_manager.close_connection()
+        os.remove(self.TEST_DB_NAME)
+        with sqlite3.connect(self.TEST_DB_NAME) as conn:
+            conn.execute(f"""
+                CREATE TABLE {results_manager.TABLE_NAME} (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, space_id TEXT NOT NULL, task_description TEXT,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP, output_type TEXT, output_data TEXT NOT NULL,
+                    parameters TEXT, notes TEXT
+                )
+            """)
+            conn.execute(f"INSERT INTO {results_manager.TABLE_NAME} (space_id, output_type, output_data) VALUES ('old/space', 'Text', 'hi')")
+        conn.close()
+
+        new_id = results_manager.add_content("space/json", "Task", "json_data", "[1]", {})
+        self.assertIsNotNone(new_id, "add_content should succeed on the old schema.")
+        inserted = results_manager.add_content_many([{'space_id': "space/many", 'task_description': "Task",
+                                                      'output_type': "text", 'output_data': "hi", 'parameters': {}}])
+        self.assertEqual(inserted, 1, "add_content_many should succeed on the old schema.")
+
+        self.assertEqual(results_manager.get_content_output(new_id), ("[1]", "[\n  1\n]"))
+        self.assertEqual(sorted(r['space_id'] for r in results_manager.filter_content(output_type="text")),
+                         ["old/space", "space/many"], "Old mixed-case output types should be migrated too.")
+
 
 if __name__ == '__main__':
     unittest.main()
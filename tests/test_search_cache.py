@@ -0,0 +1,111 @@
+import unittest
+from unittest.mock import patch
+import os
+import sys
+import tempfile
+import sqlite3
+from types import SimpleNamespace
+
+# Adjust the import path if your project structure requires it
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import search_cache
+from search_cache import cached_find_spaces, clear_search_cache
+
+def _space(space_id, **extra):
+    """A stand-in for huggingface_hub's SpaceInfo with the attributes the cache keeps."""
+    return SimpleNamespace(id=space_id, author=space_id.split('/')[0], likes=1, **extra)
+
+class TestSearchCache(unittest.TestCase):
+
+    def setUp(self):
+        """Point the cache at a throwaway database for each test."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_patcher = patch('search_cache.CACHE_DB_NAME', os.path.join(self.temp_dir.name, 'test_search_cache.db'))
+        self.db_patcher.start()
+
+    def tearDown(self):
+        self.db_patcher.stop()
+        self.temp_dir.cleanup()
+
+    @patch('search_cache.space_finder.find_spaces')
+    def test_repeat_search_served_from_cache(self, mock_find_spaces):
+        """An identical search within the TTL does not hit the Hub again."""
+        mock_find_spaces.return_value = iter([_space('user/space1'), _space('user/space2')])
+
+        first = cached_find_spaces('test task', 'likes', 5)
+        second = cached_find_spaces('test task', 'likes', 5)
+
+        self.assertEqual(first, [_space('user/space1'), _space('user/space2')])
+        self.assertEqual(second, first)
+        mock_find_spaces.assert_called_once_with(task_description='test task', sort_by='likes', limit=5)
+
+    @patch('search_cache.space_finder.find_spaces')
+    def test_key_includes_sort_and_limit(self, mock_find_spaces):
+        """Searches differing only in sort order or limit are cached separately."""
+        mock_find_spaces.side_effect = lambda **kwargs: [_space(f"{kwargs['sort_by']}/{kwargs['limit']}")]
+
+        self.assertEqual(cached_find_spaces('test task', 'likes', 5), [_space('likes/5')])
+        self.assertEqual(cached_find_spaces('test task', 'updatedAt', 5), [_space('updatedAt/5')])
+        self.assertEqual(cached_find_spaces('test task', 'likes', 10), [_space('likes/10')])
+        self.assertEqual(mock_find_spaces.call_count, 3)
+
+    @patch('search_cache.space_finder.find_spaces')
+    def test_expired_entry_is_refetched(self, mock_find_spaces):
+        """Entries older than the TTL are refreshed from the Hub."""
+        mock_find_spaces.side_effect = [[_space('user/old')], [_space('user/new')]]
+
+        self.assertEqual(cached_find_spaces('test task', ttl=300), [_space('user/old')])
+        self.assertEqual(cached_find_spaces('test task', ttl=0), [_space('user/new')])
+        self.assertEqual(cached_find_spaces('test task', ttl=300), [_space('user/new')])
+        self.assertEqual(mock_find_spaces.call_count, 2)
+
+    @patch('search_cache.space_finder.find_spaces')
+    def test_clear_search_cache(self, mock_find_spaces):
+        """clear_search_cache forces the next search to hit the Hub."""
+        mock_find_spaces.return_value = [_space('user/space1')]
+
+        cached_find_spaces('test task')
+        clear_search_cache()
+        cached_find_spaces('test task')
+
+        self.assertEqual(mock_find_spaces.call_count, 2)
+
+    @patch('search_cache.space_finder.find_spaces')
+    def test_api_error_not_cached(self, mock_find_spaces):
+        """Errors from the Hub propagate and leave nothing in the cache."""
+        mock_find_spaces.side_effect = [Exception("API Error"), [_space('user/space1')]]
+
+        with self.assertRaisesRegex(Exception, "API Error"):
+            cached_find_spaces('test task')
+        self.assertEqual(cached_find_spaces('test task'), [_space('user/space1')])
+
+    @patch('search_cache.space_finder.find_spaces')
+    def test_only_displayed_fields_cached(self, mock_find_spaces):
+        """Cached results keep the fields the GUI shows, as plain JSON, and drop everything else."""
+        space = _space('user/space1', pipeline_tag='text-to-image', cardData={'tags': ['art'], 'license': 'mit'},
+                       sdk='gradio', private=False)
+        mock_find_spaces.return_value = [space]
+
+        cached_find_spaces('test task')
+        cached = cached_find_spaces('test task')
+
+        self.assertEqual(cached, [_space('user/space1', pipeline_tag='text-to-image', cardData={'tags': ['art']})])
+        self.assertEqual(mock_find_spaces.call_count, 1)
+
+    @patch('search_cache.space_finder.find_spaces')
+    def test_unreadable_entry_is_a_miss(self, mock_find_spaces):
+        """An entry that isn't valid JSON (e.g. written by an older version) is refetched, not raised."""
+        mock_find_spaces.return_value = [_space('user/space1')]
+        with sqlite3.connect(search_cache.CACHE_DB_NAME) as conn:
+            search_cache._ensure_table(conn)
+            conn.execute(f"INSERT INTO {search_cache.CACHE_TABLE_NAME} (key, created, payload) VALUES (?, ?, ?)",
+                         (search_cache._cache_key('test task', 'likes', 10), 1e12, b'\x80\x05not json'))
+
+        self.assertEqual(cached_find_spaces('test task'), [_space('user/space1')])
+        self.assertEqual(cached_find_spaces('test task'), [_space('user/space1')])
+        self.assertEqual(mock_find_spaces.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()